@@ -0,0 +1,40 @@
+'''
+Date: 2026-10-18
+
+References:
+https://github.com/mcauser/micropython-max7219
+
+MAX7219 Module	->	Pico
+VCC	->	VBUS (5V)
+GND	->	GND
+DIN	->	GP3 (SPI0_TX)
+CS	->	GP5 (SPI0_CSN)
+CLK	->	GP2 (SPI0_SCK)
+
+Make the .anim file on a PC first, e.g.
+python3 host/make_anim.py matrix-waves.py waves.anim --frames 600
+and copy it to the Pico next to this script.
+
+'''
+
+#	animation.py
+
+from machine import Pin, SPI
+import max7219
+from anim import Player
+
+#	CONFIGURATION SETTINGS
+num_max_modules = 12   # Number of MAX7219 modules in a row
+brightness = 0         # Global brightness level (0-15)
+anim_file = "waves.anim"  # Recorded with host/make_anim.py
+fps = None             # None = the rate stored in the file
+
+#	INITIALIZE DISPLAY
+spi = SPI(0, sck=Pin(2), mosi=Pin(3))
+cs = Pin(5, Pin.OUT)
+display = max7219.Matrix8x8(spi, cs, num_max_modules)
+display.brightness(brightness)
+
+#	Frames are read from flash one at a time, nothing is drawn on the Pico
+player = Player(display, anim_file)
+player.play(fps=fps)
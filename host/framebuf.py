@@ -0,0 +1,258 @@
+"""
+CPython stand-in for MicroPython's `framebuf` module.
+
+Pixel-for-pixel compatible with the firmware for the formats and primitives
+the bar uses (MONO_VLSB, MONO_HLSB, MONO_HMSB, GS4_HMSB, GS8; fill, pixel,
+hline, vline, line, rect, fill_rect, text, scroll, blit).  text() uses a
+5x7 glyph set inside the firmware's 8x8 cell, so letter shapes differ
+slightly from the Pico but widths and positions are the same.
+"""
+
+MONO_VLSB = 0
+RGB565 = 1
+GS4_HMSB = 2
+MONO_HLSB = 3
+MONO_HMSB = 4
+GS2_HMSB = 5
+GS8 = 6
+
+MVLSB = MONO_VLSB
+
+# 5x7 ASCII glyphs, one byte per column, bit 0 = top row
+_FONT = bytes((
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x5F, 0x00, 0x00,
+    0x00, 0x07, 0x00, 0x07, 0x00, 0x14, 0x7F, 0x14, 0x7F, 0x14,
+    0x24, 0x2A, 0x7F, 0x2A, 0x12, 0x23, 0x13, 0x08, 0x64, 0x62,
+    0x36, 0x49, 0x55, 0x22, 0x50, 0x00, 0x05, 0x03, 0x00, 0x00,
+    0x00, 0x1C, 0x22, 0x41, 0x00, 0x00, 0x41, 0x22, 0x1C, 0x00,
+    0x08, 0x2A, 0x1C, 0x2A, 0x08, 0x08, 0x08, 0x3E, 0x08, 0x08,
+    0x00, 0x50, 0x30, 0x00, 0x00, 0x08, 0x08, 0x08, 0x08, 0x08,
+    0x00, 0x60, 0x60, 0x00, 0x00, 0x20, 0x10, 0x08, 0x04, 0x02,
+    0x3E, 0x51, 0x49, 0x45, 0x3E, 0x00, 0x42, 0x7F, 0x40, 0x00,
+    0x42, 0x61, 0x51, 0x49, 0x46, 0x21, 0x41, 0x45, 0x4B, 0x31,
+    0x18, 0x14, 0x12, 0x7F, 0x10, 0x27, 0x45, 0x45, 0x45, 0x39,
+    0x3C, 0x4A, 0x49, 0x49, 0x30, 0x01, 0x71, 0x09, 0x05, 0x03,
+    0x36, 0x49, 0x49, 0x49, 0x36, 0x06, 0x49, 0x49, 0x29, 0x1E,
+    0x00, 0x36, 0x36, 0x00, 0x00, 0x00, 0x56, 0x36, 0x00, 0x00,
+    0x00, 0x08, 0x14, 0x22, 0x41, 0x14, 0x14, 0x14, 0x14, 0x14,
+    0x41, 0x22, 0x14, 0x08, 0x00, 0x02, 0x01, 0x51, 0x09, 0x06,
+    0x32, 0x49, 0x79, 0x41, 0x3E, 0x7E, 0x11, 0x11, 0x11, 0x7E,
+    0x7F, 0x49, 0x49, 0x49, 0x36, 0x3E, 0x41, 0x41, 0x41, 0x22,
+    0x7F, 0x41, 0x41, 0x22, 0x1C, 0x7F, 0x49, 0x49, 0x49, 0x41,
+    0x7F, 0x09, 0x09, 0x01, 0x01, 0x3E, 0x41, 0x41, 0x51, 0x32,
+    0x7F, 0x08, 0x08, 0x08, 0x7F, 0x00, 0x41, 0x7F, 0x41, 0x00,
+    0x20, 0x40, 0x41, 0x3F, 0x01, 0x7F, 0x08, 0x14, 0x22, 0x41,
+    0x7F, 0x40, 0x40, 0x40, 0x40, 0x7F, 0x02, 0x04, 0x02, 0x7F,
+    0x7F, 0x04, 0x08, 0x10, 0x7F, 0x3E, 0x41, 0x41, 0x41, 0x3E,
+    0x7F, 0x09, 0x09, 0x09, 0x06, 0x3E, 0x41, 0x51, 0x21, 0x5E,
+    0x7F, 0x09, 0x19, 0x29, 0x46, 0x46, 0x49, 0x49, 0x49, 0x31,
+    0x01, 0x01, 0x7F, 0x01, 0x01, 0x3F, 0x40, 0x40, 0x40, 0x3F,
+    0x1F, 0x20, 0x40, 0x20, 0x1F, 0x7F, 0x20, 0x18, 0x20, 0x7F,
+    0x63, 0x14, 0x08, 0x14, 0x63, 0x03, 0x04, 0x78, 0x04, 0x03,
+    0x61, 0x51, 0x49, 0x45, 0x43, 0x00, 0x00, 0x7F, 0x41, 0x41,
+    0x02, 0x04, 0x08, 0x10, 0x20, 0x41, 0x41, 0x7F, 0x00, 0x00,
+    0x04, 0x02, 0x01, 0x02, 0x04, 0x40, 0x40, 0x40, 0x40, 0x40,
+    0x00, 0x01, 0x02, 0x04, 0x00, 0x20, 0x54, 0x54, 0x54, 0x78,
+    0x7F, 0x48, 0x44, 0x44, 0x38, 0x38, 0x44, 0x44, 0x44, 0x20,
+    0x38, 0x44, 0x44, 0x48, 0x7F, 0x38, 0x54, 0x54, 0x54, 0x18,
+    0x08, 0x7E, 0x09, 0x01, 0x02, 0x08, 0x14, 0x54, 0x54, 0x3C,
+    0x7F, 0x08, 0x04, 0x04, 0x78, 0x00, 0x44, 0x7D, 0x40, 0x00,
+    0x20, 0x40, 0x44, 0x3D, 0x00, 0x00, 0x7F, 0x10, 0x28, 0x44,
+    0x00, 0x41, 0x7F, 0x40, 0x00, 0x7C, 0x04, 0x18, 0x04, 0x78,
+    0x7C, 0x08, 0x04, 0x04, 0x78, 0x38, 0x44, 0x44, 0x44, 0x38,
+    0x7C, 0x14, 0x14, 0x14, 0x08, 0x08, 0x14, 0x14, 0x18, 0x7C,
+    0x7C, 0x08, 0x04, 0x04, 0x08, 0x48, 0x54, 0x54, 0x54, 0x20,
+    0x04, 0x3F, 0x44, 0x40, 0x20, 0x3C, 0x40, 0x40, 0x20, 0x7C,
+    0x1C, 0x20, 0x40, 0x20, 0x1C, 0x3C, 0x40, 0x30, 0x40, 0x3C,
+    0x44, 0x28, 0x10, 0x28, 0x44, 0x0C, 0x50, 0x50, 0x50, 0x3C,
+    0x44, 0x64, 0x54, 0x4C, 0x44, 0x00, 0x08, 0x36, 0x41, 0x00,
+    0x00, 0x00, 0x7F, 0x00, 0x00, 0x00, 0x41, 0x36, 0x08, 0x00,
+    0x08, 0x08, 0x2A, 0x1C, 0x08,
+))
+
+
+class FrameBuffer:
+    def __init__(self, buffer, width, height, format, stride=None):
+        self.buf = buffer
+        self.width = width
+        self.height = height
+        self.format = format
+        self.stride = width if stride is None else stride
+        if format == MONO_VLSB:
+            size = ((height + 7) >> 3) * self.stride
+        elif format in (MONO_HLSB, MONO_HMSB):
+            size = ((self.stride + 7) >> 3) * height
+        elif format == GS4_HMSB:
+            size = ((self.stride + 1) >> 1) * height
+        elif format == GS8:
+            size = self.stride * height
+        else:
+            raise ValueError("invalid format")
+        if len(buffer) < size:
+            raise ValueError("buffer too small")
+
+    # Raw pixel access, no clipping
+    def _get(self, x, y):
+        fmt = self.format
+        buf = self.buf
+        if fmt == MONO_HLSB:
+            i = (x + y * ((self.stride + 7) & ~7)) >> 3
+            return (buf[i] >> (7 - (x & 7))) & 1
+        if fmt == MONO_HMSB:
+            i = (x + y * ((self.stride + 7) & ~7)) >> 3
+            return (buf[i] >> (x & 7)) & 1
+        if fmt == MONO_VLSB:
+            return (buf[(y >> 3) * self.stride + x] >> (y & 7)) & 1
+        if fmt == GS4_HMSB:
+            b = buf[(x + y * self.stride) >> 1]
+            return (b & 0x0F) if x & 1 else (b >> 4)
+        return buf[x + y * self.stride]
+
+    def _set(self, x, y, c):
+        fmt = self.format
+        buf = self.buf
+        if fmt == MONO_HLSB or fmt == MONO_HMSB:
+            i = (x + y * ((self.stride + 7) & ~7)) >> 3
+            mask = (0x80 >> (x & 7)) if fmt == MONO_HLSB else (1 << (x & 7))
+            buf[i] = (buf[i] | mask) if c & 1 else (buf[i] & ~mask & 0xFF)
+        elif fmt == MONO_VLSB:
+            i = (y >> 3) * self.stride + x
+            mask = 1 << (y & 7)
+            buf[i] = (buf[i] | mask) if c & 1 else (buf[i] & ~mask & 0xFF)
+        elif fmt == GS4_HMSB:
+            i = (x + y * self.stride) >> 1
+            if x & 1:
+                buf[i] = (buf[i] & 0xF0) | (c & 0x0F)
+            else:
+                buf[i] = (buf[i] & 0x0F) | ((c & 0x0F) << 4)
+        else:
+            buf[x + y * self.stride] = c & 0xFF
+
+    def fill(self, c):
+        self.fill_rect(0, 0, self.width, self.height, c)
+
+    def pixel(self, x, y, c=None):
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        if c is None:
+            return self._get(x, y)
+        self._set(x, y, c)
+
+    def fill_rect(self, x, y, w, h, c):
+        if w < 1 or h < 1 or x + w <= 0 or y + h <= 0 or x >= self.width or y >= self.height:
+            return
+        xend = min(self.width, x + w)
+        yend = min(self.height, y + h)
+        x = max(x, 0)
+        y = max(y, 0)
+        for yy in range(y, yend):
+            for xx in range(x, xend):
+                self._set(xx, yy, c)
+
+    def hline(self, x, y, w, c):
+        self.fill_rect(x, y, w, 1, c)
+
+    def vline(self, x, y, h, c):
+        self.fill_rect(x, y, 1, h, c)
+
+    def rect(self, x, y, w, h, c, f=False):
+        if f:
+            self.fill_rect(x, y, w, h, c)
+            return
+        self.fill_rect(x, y, w, 1, c)
+        self.fill_rect(x, y + h - 1, w, 1, c)
+        self.fill_rect(x, y, 1, h, c)
+        self.fill_rect(x + w - 1, y, 1, h, c)
+
+    def line(self, x1, y1, x2, y2, c):
+        dx = x2 - x1
+        sx = 1 if dx > 0 else -1
+        dx = abs(dx)
+        dy = y2 - y1
+        sy = 1 if dy > 0 else -1
+        dy = abs(dy)
+        steep = dy > dx
+        if steep:
+            x1, y1 = y1, x1
+            dx, dy = dy, dx
+            sx, sy = sy, sx
+        e = 2 * dy - dx
+        for _ in range(dx):
+            if steep:
+                self.pixel(y1, x1, c)
+            else:
+                self.pixel(x1, y1, c)
+            while e >= 0:
+                y1 += sy
+                e -= 2 * dx
+            x1 += sx
+            e += 2 * dy
+        self.pixel(x2, y2, c)
+
+    def text(self, s, x, y, c=1):
+        for ch in s:
+            code = ord(ch)
+            if code < 32 or code > 126:
+                code = 127
+            base = (code - 32) * 5
+            for col in range(8):
+                line = _FONT[base + col] if col < 5 and code < 127 else 0
+                if code == 127 and col < 7:
+                    line = 0x7F
+                xx = x + col
+                if 0 <= xx < self.width:
+                    for row in range(8):
+                        if line & 1:
+                            yy = y + row
+                            if 0 <= yy < self.height:
+                                self._set(xx, yy, c)
+                        line >>= 1
+            x += 8
+
+    def scroll(self, xstep, ystep):
+        if xstep < 0:
+            sx, xend, dx = 0, self.width + xstep, 1
+            if xend <= 0:
+                return
+        else:
+            sx, xend, dx = self.width - 1, xstep - 1, -1
+            if xend >= sx:
+                return
+        if ystep < 0:
+            y, yend, dy = 0, self.height + ystep, 1
+            if yend <= 0:
+                return
+        else:
+            y, yend, dy = self.height - 1, ystep - 1, -1
+            if yend >= y:
+                return
+        while y != yend:
+            x = sx
+            while x != xend:
+                self._set(x, y, self._get(x - xstep, y - ystep))
+                x += dx
+            y += dy
+
+    def blit(self, fbuf, x, y, key=-1, palette=None):
+        if isinstance(fbuf, tuple):
+            fbuf = FrameBuffer(*fbuf)
+        if x >= self.width or y >= self.height or -x >= fbuf.width or -y >= fbuf.height:
+            return
+        x0 = max(0, x)
+        y0 = max(0, y)
+        x1 = max(0, -x)
+        y1 = max(0, -y)
+        x0end = min(self.width, x + fbuf.width)
+        y0end = min(self.height, y + fbuf.height)
+        for cy in range(y0, y0end):
+            sy = y1 + cy - y0
+            for cx in range(x0, x0end):
+                col = fbuf._get(x1 + cx - x0, sy)
+                if palette is not None:
+                    col = palette._get(col, 0)
+                if col != key:
+                    self._set(cx, cy, col)
+
+
+def FrameBuffer1(buffer, width, height, format=MONO_VLSB, stride=None):
+    return FrameBuffer(buffer, width, height, format, stride)
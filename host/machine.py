@@ -0,0 +1,154 @@
+"""
+CPython stand-in for the parts of MicroPython's `machine` module the bar uses.
+
+Pin and SPI record what the firmware would drive onto the wires; anything
+that wants to listen (max7219_sim.Max7219Chain) attaches with watch().
+Timer fires its callback from a background thread.  ADC channel 4 (the
+RP2040's temperature sensor) reads about 27 C with a little drift.
+"""
+
+import random
+import threading
+import time as _time
+
+
+class Pin:
+    IN = 0
+    OUT = 1
+    OPEN_DRAIN = 2
+    PULL_UP = 1
+    PULL_DOWN = 2
+
+    def __init__(self, id, mode=-1, pull=-1, value=None):
+        self.id = id
+        self.mode = mode
+        self._value = 0
+        self._watchers = []
+        if value is not None:
+            self._value = 1 if value else 0
+
+    def init(self, mode=-1, value=None, pull=-1):
+        if mode != -1:
+            self.mode = mode
+        if value is not None:
+            self.value(value)
+
+    def watch(self, callback):
+        """Call callback(level) on every write to the pin."""
+        self._watchers.append(callback)
+
+    def value(self, v=None):
+        if v is None:
+            return self._value
+        self._value = 1 if v else 0
+        for callback in self._watchers:
+            callback(self._value)
+
+    __call__ = value
+
+    def on(self):
+        self.value(1)
+
+    def off(self):
+        self.value(0)
+
+    def __repr__(self):
+        return "Pin(%s)" % (self.id,)
+
+
+class SPI:
+    MSB = 0
+    LSB = 1
+
+    def __init__(self, id, baudrate=1000000, polarity=0, phase=0, bits=8,
+                 firstbit=MSB, sck=None, mosi=None, miso=None):
+        self.id = id
+        self.baudrate = baudrate
+        self._watchers = []
+
+    def init(self, baudrate=None, **kwargs):
+        if baudrate is not None:
+            self.baudrate = baudrate
+
+    def deinit(self):
+        pass
+
+    def watch(self, callback):
+        """Call callback(data) with the bytes of every write()."""
+        self._watchers.append(callback)
+
+    def write(self, buf):
+        data = bytes(buf)
+        for callback in self._watchers:
+            callback(data)
+
+    def readinto(self, buf, write=0):
+        for i in range(len(buf)):
+            buf[i] = write
+
+    def write_readinto(self, write_buf, read_buf):
+        self.write(write_buf)
+        self.readinto(read_buf)
+
+    def __repr__(self):
+        return "SPI(%d, baudrate=%d)" % (self.id, self.baudrate)
+
+
+class Timer:
+    ONE_SHOT = 0
+    PERIODIC = 1
+
+    def __init__(self, id=-1, **kwargs):
+        self.id = id
+        self._stop = None
+        if kwargs:
+            self.init(**kwargs)
+
+    def init(self, mode=PERIODIC, freq=-1, period=-1, callback=None, hard=False):
+        self.deinit()
+        if freq > 0:
+            interval = 1.0 / freq
+        else:
+            interval = period / 1000.0
+        stop = threading.Event()
+        self._stop = stop
+
+        def run():
+            deadline = _time.perf_counter()
+            while True:
+                deadline += interval
+                if stop.wait(max(0.0, deadline - _time.perf_counter())):
+                    return
+                callback(self)
+                if mode == Timer.ONE_SHOT:
+                    return
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def deinit(self):
+        if self._stop is not None:
+            self._stop.set()
+            self._stop = None
+
+
+class ADC:
+    def __init__(self, pin):
+        self.pin = pin
+
+    def read_u16(self):
+        if self.pin == 4:
+            volts = 0.706 - 0.001721 * random.uniform(-2.0, 2.0)  # 25-29 C
+            return int(volts / 3.3 * 65535)
+        return random.getrandbits(16)
+
+
+def freq(hz=None):
+    return 125000000
+
+
+def reset():
+    raise SystemExit("machine.reset()")
+
+
+def unique_id():
+    return b"\x00host\x00\x00\x00"
@@ -0,0 +1,120 @@
+"""
+Record one of the bar scripts into an .anim file for lib/anim.py.
+
+    python3 host/make_anim.py matrix-waves.py waves.anim --frames 600 --fps 20
+    python3 host/make_anim.py pole_position.py road.anim --keyframe 100
+
+The script runs against the host stand-ins (no sleeping) and every show()
+of its display is captured.  Each frame is stored as whichever is smallest:
+the changed rows, or a run-length coded XOR against the previous frame, with
+a full keyframe every --keyframe frames so the player can seek.  Copy the
+file to the Pico and play it with anim.Player (see animation.py).
+"""
+
+import os
+import struct
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [HERE, os.path.join(os.path.dirname(HERE), "lib")]
+
+import anim  # noqa: E402
+import max7219  # noqa: E402
+from run import Done, add_micropython_extras, skip_sleeps  # noqa: E402
+from stream_sender import rle  # noqa: E402
+
+
+class Writer:
+    def __init__(self, path, width, height, fps, keyframe_every):
+        self.file = open(path, "wb")
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.keyframe_every = max(1, keyframe_every)
+        self.stride = width >> 3
+        self.previous = None
+        self.keyframes = []
+        self.frames = 0
+        self.counts = {anim.KEY: 0, anim.ROWS: 0, anim.XOR: 0}
+        self.file.write(bytes(anim.HEADER_SIZE))  # Filled in by close()
+
+    def add(self, frame):
+        frame = bytes(frame)
+        if self.frames % self.keyframe_every == 0:
+            self.keyframes.append(self.file.tell())
+            record = bytes((anim.KEY,)) + frame
+        else:
+            stride = self.stride
+            mask = bytearray((self.height + 7) >> 3)
+            rows = bytearray()
+            for y in range(self.height):
+                row = frame[y * stride:(y + 1) * stride]
+                if row != self.previous[y * stride:(y + 1) * stride]:
+                    mask[y >> 3] |= 1 << (y & 7)
+                    rows += row
+            record = bytes((anim.ROWS,)) + mask + rows
+            packed = rle(bytes(a ^ b for a, b in zip(frame, self.previous)))
+            if len(packed) + 3 < len(record):
+                record = bytes((anim.XOR, len(packed) & 0xFF, len(packed) >> 8)) + packed
+        self.counts[record[0]] += 1
+        self.file.write(record)
+        self.previous = frame
+        self.frames += 1
+
+    def close(self):
+        index = self.file.tell()
+        for offset in self.keyframes:
+            self.file.write(struct.pack("<I", offset))
+        self.file.seek(0)
+        self.file.write(struct.pack(anim.HEADER, anim.MAGIC, anim.VERSION, self.height, self.width,
+                                    self.fps, 0, self.keyframe_every, self.frames, index))
+        size = self.file.seek(0, 2)
+        self.file.close()
+        return size
+
+
+def main(argv):
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("script")
+    parser.add_argument("output")
+    parser.add_argument("--frames", type=int, default=300, help="frames to record")
+    parser.add_argument("--fps", type=int, default=20, help="playback rate stored in the file")
+    parser.add_argument("--keyframe", type=int, default=50, help="full frame every N frames")
+    args = parser.parse_args(argv)
+    add_micropython_extras()
+    skip_sleeps()
+
+    show = max7219.Matrix8x8.show
+    writer = None
+
+    def capture(self, *a, **kw):
+        nonlocal writer
+        result = show(self, *a, **kw)
+        if writer is None:
+            writer = Writer(args.output, self.width, self.height, args.fps, args.keyframe)
+        writer.add(self.buffer)
+        if writer.frames >= args.frames:
+            raise Done()
+        return result
+
+    max7219.Matrix8x8.show = capture
+    path = os.path.abspath(args.script)
+    sys.path.insert(0, os.path.dirname(path))
+    code = compile(open(path).read(), path, "exec")
+    try:
+        exec(code, {"__name__": "__main__", "__file__": path})
+    except (Done, KeyboardInterrupt):
+        pass
+    if writer is None:
+        sys.exit("%s never called show()" % args.script)
+    size = writer.close()
+    raw = writer.frames * len(writer.previous)
+    print("%s: %d frames, %d bytes (%.0f%% of raw); %d keyframes, %d row deltas, %d XOR deltas" % (
+        args.output, writer.frames, size, 100.0 * size / raw, writer.counts[anim.KEY],
+        writer.counts[anim.ROWS], writer.counts[anim.XOR]))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,128 @@
+"""
+Wire-level model of a cascaded MAX7219 chain for host testing.
+
+Attach it to the fake SPI bus and chip-select pin from host/machine.py and it
+shifts every byte through the chain the way the real parts do: while CS is
+low each byte enters the first module and pushes the oldest one out of the
+far end, and on the rising CS edge every module latches the 16-bit word
+sitting in its own shift register.  NOOP words leave a module untouched.
+
+Modules are numbered in the order show() sends them, so module m displays
+columns 8m..8m+7 and frame() can be compared byte-for-byte with
+Matrix8x8.buffer.
+"""
+
+_NOOP = 0
+_DIGIT0 = 1
+_DECODEMODE = 9
+_INTENSITY = 10
+_SCANLIMIT = 11
+_SHUTDOWN = 12
+_DISPLAYTEST = 15
+
+
+class Module:
+    def __init__(self):
+        self.digits = bytearray(8)
+        self.decode = 0
+        self.intensity = 0
+        self.scan_limit = 0
+        self.shutdown = True
+        self.display_test = False
+        self.writes = 0
+
+    def latch(self, register, data):
+        register &= 0x0F
+        if register == _NOOP:
+            return
+        self.writes += 1
+        if _DIGIT0 <= register <= _DIGIT0 + 7:
+            self.digits[register - _DIGIT0] = data
+        elif register == _DECODEMODE:
+            self.decode = data
+        elif register == _INTENSITY:
+            self.intensity = data & 0x0F
+        elif register == _SCANLIMIT:
+            self.scan_limit = data & 0x07
+        elif register == _SHUTDOWN:
+            self.shutdown = not (data & 1)
+        elif register == _DISPLAYTEST:
+            self.display_test = bool(data & 1)
+
+    def lit(self, row, col):
+        """LED state as seen from the front: col 0 is the MSB of the digit."""
+        if self.display_test:
+            return True
+        if self.shutdown or row > self.scan_limit:
+            return False
+        return bool(self.digits[row] & (0x80 >> col))
+
+
+class Max7219Chain:
+    def __init__(self, spi, cs, num):
+        self.num = num
+        self.modules = [Module() for _ in range(num)]
+        self._shift = bytearray(2 * num)
+        self._cs = cs.value()
+        self.reset_counters()
+        spi.watch(self._on_data)
+        cs.watch(self._on_cs)
+
+    def reset_counters(self):
+        self.bytes = 0
+        self.transactions = 0
+        self.cs_toggles = 0
+        self.ignored_bytes = 0
+
+    def counters(self):
+        return {
+            "bytes": self.bytes,
+            "transactions": self.transactions,
+            "cs_toggles": self.cs_toggles,
+            "ignored_bytes": self.ignored_bytes,
+        }
+
+    def _on_data(self, data):
+        if self._cs:
+            # CS high: the chain ignores the clock
+            self.ignored_bytes += len(data)
+            return
+        self.bytes += len(data)
+        shift = self._shift
+        for b in data:
+            shift[:-1] = shift[1:]
+            shift[-1] = b
+
+    def _on_cs(self, level):
+        if level == self._cs:
+            return
+        self.cs_toggles += 1
+        self._cs = level
+        if level:
+            self.transactions += 1
+            shift = self._shift
+            for m, module in enumerate(self.modules):
+                module.latch(shift[2 * m], shift[2 * m + 1])
+
+    def frame(self):
+        """Digit registers in Matrix8x8.buffer layout (row-major, module per byte)."""
+        num = self.num
+        out = bytearray(8 * num)
+        for m, module in enumerate(self.modules):
+            for row in range(8):
+                out[row * num + m] = module.digits[row]
+        return out
+
+    def intensities(self):
+        return [module.intensity for module in self.modules]
+
+    def render(self, on="#", off="."):
+        """ASCII picture of what the LEDs are showing."""
+        lines = []
+        for row in range(8):
+            line = []
+            for module in self.modules:
+                for col in range(8):
+                    line.append(on if module.lit(row, col) else off)
+            lines.append("".join(line))
+        return "\n".join(lines)
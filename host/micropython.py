@@ -0,0 +1,35 @@
+"""
+CPython stand-in for the MicroPython `micropython` module.
+
+Only what the scripts and lib/ use: const() and the code-emitter
+decorators are identities, schedule() runs the callback straight away.
+"""
+
+
+def const(value):
+    return value
+
+
+def native(func):
+    return func
+
+
+def viper(func):
+    return func
+
+
+def schedule(func, arg):
+    func(arg)
+    return True
+
+
+def alloc_emergency_exception_buf(size):
+    pass
+
+
+def mem_info(verbose=False):
+    print("mem: host build, no heap statistics")
+
+
+def kbd_intr(chr):
+    pass
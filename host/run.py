@@ -0,0 +1,118 @@
+"""
+Run one of the bar scripts on a Linux box against the MAX7219 chain model.
+
+    python3 host/run.py pong.py --frames 200
+    python3 host/run.py scrolling.py --quiet --fast
+
+Every Matrix8x8 the script creates gets a Max7219Chain wired to its SPI bus
+and CS pin.  After each show() the LEDs are drawn in the terminal, the chain
+state is checked against display.buffer, and the SPI cost of the frame
+(bytes, transactions, CS toggles) is printed.
+"""
+
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [HERE, os.path.join(os.path.dirname(HERE), "lib")]
+
+import asyncio  # noqa: E402
+import gc  # noqa: E402
+import time  # noqa: E402
+
+import max7219  # noqa: E402
+import utime  # noqa: E402
+from max7219_sim import Max7219Chain  # noqa: E402
+
+
+class Done(Exception):
+    pass
+
+
+def add_micropython_extras():
+    """Give CPython's time, gc and asyncio the MicroPython-only calls the scripts use."""
+    for name in ("ticks_ms", "ticks_us", "ticks_diff", "ticks_add", "sleep_ms", "sleep_us"):
+        if not hasattr(time, name):
+            setattr(time, name, getattr(utime, name))
+    if not hasattr(asyncio, "sleep_ms"):
+        asyncio.sleep_ms = lambda ms: asyncio.sleep(ms / 1000)
+    if not hasattr(gc, "mem_free"):
+        gc.mem_free = lambda: 200 * 1024
+        gc.mem_alloc = lambda: 0
+
+
+def skip_sleeps():
+    """
+    Make every sleep the scripts use return at once (time, utime and the
+    asyncio ones Runtime awaits), moving the utime clock on instead so
+    frame deadlines and playlist timings still work out.
+    """
+    utime.fast_forward()
+    for name in ("sleep", "sleep_ms", "sleep_us"):
+        setattr(time, name, getattr(utime, name))
+    real_sleep = asyncio.sleep
+
+    async def sleep(delay, result=None):
+        utime.sleep(delay)
+        return await real_sleep(0, result)  # Still let the other tasks run
+
+    asyncio.sleep = sleep
+    asyncio.sleep_ms = lambda ms: sleep(ms / 1000)
+
+
+def main(argv):
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("script")
+    parser.add_argument("--frames", type=int, default=0, help="stop after N frames (0 = run forever)")
+    parser.add_argument("--quiet", action="store_true", help="don't draw frames, just print totals")
+    parser.add_argument("--fast", action="store_true", help="skip the sleeps (time, utime and asyncio)")
+    args = parser.parse_args(argv)
+    add_micropython_extras()
+
+    totals = {"frames": 0, "bytes": 0, "transactions": 0, "cs_toggles": 0}
+    init = max7219.Matrix8x8.__init__
+    show = max7219.Matrix8x8.show
+
+    def patched_init(self, spi, cs, num, *a, **kw):
+        self.chain = Max7219Chain(spi, cs, num)
+        init(self, spi, cs, num, *a, **kw)
+
+    def patched_show(self, *a, **kw):
+        self.chain.reset_counters()
+        result = show(self, *a, **kw)
+        counters = self.chain.counters()
+        totals["frames"] += 1
+        for key in ("bytes", "transactions", "cs_toggles"):
+            totals[key] += counters[key]
+        if not self.brightness_mode and not self._pipeline and self.chain.frame() != self._frame():
+            raise AssertionError("chain state differs from display.buffer")
+        if not args.quiet:
+            sys.stdout.write("\x1b[H\x1b[2J%s\nframe %d: %d bytes, %d transactions, %d CS toggles\n" % (
+                self.chain.render(), totals["frames"], counters["bytes"],
+                counters["transactions"], counters["cs_toggles"]))
+        if args.frames and totals["frames"] >= args.frames:
+            raise Done()
+        return result
+
+    max7219.Matrix8x8.__init__ = patched_init
+    max7219.Matrix8x8.show = patched_show
+    if args.fast:
+        skip_sleeps()
+
+    path = os.path.abspath(args.script)
+    sys.path.insert(0, os.path.dirname(path))
+    code = compile(open(path).read(), path, "exec")
+    try:
+        exec(code, {"__name__": "__main__", "__file__": path})
+    except (Done, KeyboardInterrupt):
+        pass
+    frames = totals["frames"] or 1
+    print("%d frames, %.1f bytes / %.1f transactions / %.1f CS toggles per frame" % (
+        totals["frames"], totals["bytes"] / frames, totals["transactions"] / frames,
+        totals["cs_toggles"] / frames))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,223 @@
+"""
+Stream frames to a Pico running main.py with stream_mode = True.
+
+    python3 host/stream_sender.py /dev/ttyACM0 --bench 5
+    python3 host/stream_sender.py /dev/ttyACM0 --pattern noise --mode rle
+    some_renderer | python3 host/stream_sender.py /dev/ttyACM0 --stdin
+    python3 host/stream_sender.py --loopback --bench 2
+
+Frames are num * 8 bytes in Matrix8x8.buffer layout (row y, module m at
+y * num + m, MSB = leftmost column).  See lib/stream.py for the packet
+format.  Uses pyserial if it is installed, otherwise opens the tty
+directly (Linux/macOS).  USB CDC ignores the baud rate, so the limit is
+the USB link and how fast the Pico gets through show().
+
+--loopback skips the Pico: packets are decoded by lib/stream.py on this
+machine (host stand-ins) and checked against what was sent.
+"""
+
+import os
+import random
+import sys
+import threading
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+RAW = 0
+XOR = 1
+RLE = 2
+EXIT = 0xFF
+SYNC = b"\xa5\x5a"
+
+
+def packet(kind, payload=b""):
+    n = len(payload)
+    return SYNC + bytes((kind, n & 0xFF, n >> 8)) + bytes(payload)
+
+
+def rle(delta):
+    """Runs of unchanged (zero) bytes become one skip byte, the rest go as literals."""
+    out = bytearray()
+    i = 0
+    n = len(delta)
+    while i < n:
+        start = i
+        if delta[i] == 0:
+            while i < n and delta[i] == 0 and i - start < 128:
+                i += 1
+            if i == n:
+                break  # trailing skip is implied
+            out.append(i - start - 1)
+        else:
+            while i < n and delta[i] != 0 and i - start < 128:
+                i += 1
+            out.append(0x80 | (i - start - 1))
+            out += delta[start:i]
+    return bytes(out)
+
+
+class Encoder:
+    """Turns frames into packets, sending a raw keyframe every keyframe_every frames."""
+
+    def __init__(self, size, mode="rle", keyframe_every=30):
+        self.size = size
+        self.mode = mode
+        self.keyframe_every = keyframe_every
+        self.previous = None
+        self.count = 0
+
+    def encode(self, frame):
+        frame = bytes(frame)
+        if len(frame) != self.size:
+            raise ValueError("frame must be %d bytes" % self.size)
+        key = self.previous is None or self.mode == "raw" or (
+            self.keyframe_every and self.count % self.keyframe_every == 0)
+        self.count += 1
+        previous, self.previous = self.previous, frame
+        if key:
+            return packet(RAW, frame)
+        delta = bytes(a ^ b for a, b in zip(frame, previous))
+        if self.mode == "xor":
+            return packet(XOR, delta)
+        packed = rle(delta)
+        if len(packed) < self.size:
+            return packet(RLE, packed)
+        return packet(RAW, frame)  # busy frame, RLE would not save anything
+
+
+def patterns(name, num):
+    """Endless test frames: "bar" sweeps a column across the bar, "noise" is worst case."""
+    size = num * 8
+    width = num * 8
+    x = 0
+    while True:
+        if name == "noise":
+            yield bytes(random.getrandbits(8) for _ in range(size))
+            continue
+        frame = bytearray(size)
+        for y in range(8):
+            frame[y * num + (x >> 3)] = 0x80 >> (x & 7)
+        yield bytes(frame)
+        x = (x + 1) % width
+
+
+def read_frames(stream, size):
+    while True:
+        frame = stream.read(size)
+        if len(frame) < size:
+            return
+        yield frame
+
+
+def open_port(path):
+    try:
+        import serial
+    except ImportError:
+        import termios
+        import tty
+
+        fd = os.open(path, os.O_RDWR | os.O_NOCTTY)
+        tty.setraw(fd)
+        attrs = termios.tcgetattr(fd)
+        attrs[2] |= termios.CLOCAL
+        termios.tcsetattr(fd, termios.TCSANOW, attrs)
+        return os.fdopen(fd, "r+b", buffering=0)
+    return serial.Serial(path, 115200, timeout=1)
+
+
+class Loopback:
+    """A pipe into lib/stream.py's StreamReceiver, checking every decoded frame."""
+
+    def __init__(self, num):
+        sys.path[:0] = [HERE, os.path.join(os.path.dirname(HERE), "lib")]
+        import max7219
+        from machine import SPI, Pin
+        from stream import StreamReceiver
+
+        read_fd, write_fd = os.pipe()
+        self._pipe = os.fdopen(write_fd, "wb", buffering=0)
+        display = max7219.Matrix8x8(SPI(0), Pin(5, Pin.OUT), num)
+        self.receiver = StreamReceiver(display, os.fdopen(read_fd, "rb", buffering=0))
+        self.expected = []
+        self.errors = 0
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while self.receiver.receive() != EXIT:
+            if bytes(self.receiver.display.buffer) != self.expected.pop(0):
+                self.errors += 1
+
+    def send(self, data, frame=None):
+        if frame is not None:
+            self.expected.append(frame)
+        self._pipe.write(data)
+
+    def close(self):
+        self._pipe.write(packet(EXIT))
+        self._thread.join()
+
+
+def stream(port, frames, encoder, limit_s=0.0):
+    """Send frames until they run out (or limit_s passes). Returns (frames, bytes, seconds)."""
+    sent = 0
+    total = 0
+    start = time.perf_counter()
+    for frame in frames:
+        data = encoder.encode(frame)
+        if isinstance(port, Loopback):
+            port.send(data, frame)
+        else:
+            port.write(data)
+        sent += 1
+        total += len(data)
+        elapsed = time.perf_counter() - start
+        if limit_s and elapsed >= limit_s:
+            break
+    return sent, total, time.perf_counter() - start
+
+
+def main(argv):
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("port", nargs="?", help="serial device, e.g. /dev/ttyACM0")
+    parser.add_argument("--modules", type=int, default=12, help="num_max_modules on the Pico")
+    parser.add_argument("--mode", choices=("raw", "xor", "rle"), default="rle")
+    parser.add_argument("--keyframe", type=int, default=30, help="raw frame every N frames (0 = first only)")
+    parser.add_argument("--pattern", choices=("bar", "noise"), default="bar")
+    parser.add_argument("--stdin", action="store_true", help="send raw frames read from stdin")
+    parser.add_argument("--bench", type=float, default=0, help="send each mode for N seconds and compare")
+    parser.add_argument("--loopback", action="store_true", help="decode locally instead of using a port")
+    parser.add_argument("--no-exit", action="store_true", help="leave the Pico in stream mode afterwards")
+    args = parser.parse_args(argv)
+    if not args.port and not args.loopback:
+        parser.error("give a serial port or --loopback")
+
+    size = args.modules * 8
+    port = Loopback(args.modules) if args.loopback else open_port(args.port)
+    try:
+        if args.bench:
+            print("%-5s %8s %10s %9s" % ("mode", "fps", "bytes/s", "bytes/f"))
+            for mode in ("raw", "xor", "rle"):
+                encoder = Encoder(size, mode, args.keyframe)
+                n, total, seconds = stream(port, patterns(args.pattern, args.modules), encoder, args.bench)
+                print("%-5s %8.0f %10.0f %9.1f" % (mode, n / seconds, total / seconds, total / n))
+        else:
+            source = read_frames(sys.stdin.buffer, size) if args.stdin else patterns(args.pattern, args.modules)
+            n, total, seconds = stream(port, source, Encoder(size, args.mode, args.keyframe))
+            print("%d frames, %.0f fps, %.0f bytes/s" % (n, n / seconds, total / seconds))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if isinstance(port, Loopback):
+            port.close()
+            print("loopback: %d frames decoded, %d mismatched, %d bad packets"
+                  % (port.receiver.frames, port.errors, port.receiver.bad_packets))
+        elif not args.no_exit:
+            port.write(packet(EXIT))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,67 @@
+"""
+CPython stand-in for MicroPython's `utime` / `time` tick functions.
+
+The tick counters start at import, the same way the Pico's start at reset.
+After fast_forward() the sleeps return at once and move the tick counters
+on by the time they would have taken, so deadline and timeout code still
+sees time pass (host/run.py --fast, host/make_anim.py).
+"""
+
+import time as _time
+
+_T0 = _time.perf_counter_ns()
+_fast = False
+_skipped = 0  # ns added to the clock by skipped sleeps
+
+
+def fast_forward(on=True):
+    global _fast
+    _fast = on
+
+
+def _wait(ns):
+    global _skipped
+    if _fast:
+        _skipped += ns
+    else:
+        _time.sleep(ns / 1000000000)
+
+
+def ticks_ns():
+    return _time.perf_counter_ns() - _T0 + _skipped
+
+
+def ticks_us():
+    return ticks_ns() // 1000
+
+
+def ticks_ms():
+    return ticks_ns() // 1000000
+
+
+def ticks_cpu():
+    return ticks_us()
+
+
+def ticks_diff(end, start):
+    return end - start
+
+
+def ticks_add(ticks, delta):
+    return ticks + delta
+
+
+def sleep(seconds):
+    _wait(int(seconds * 1000000000))
+
+
+def sleep_ms(ms):
+    _wait(ms * 1000000)
+
+
+def sleep_us(us):
+    _wait(us * 1000)
+
+
+def time():
+    return int(_time.time())
@@ -0,0 +1,123 @@
+"""
+Play precomputed animations from flash.
+
+host/make_anim.py records any of the scripts into an .anim file; Player
+then shows it with no drawing code at all, reading each frame through one
+fixed buffer the size of display.buffer.
+
+File layout (little endian):
+
+    header  b"M7AN", version, height, width (2), fps, 0, keyframe_every (2),
+            frame count (4), index offset (4)
+    frames  one record per frame, starting with its type byte:
+              0 KEY   the whole buffer
+              1 ROWS  row mask ((height + 7) // 8 bytes, bit y = row y),
+                      then the new contents of each changed row
+              2 XOR   length (2), then an XOR delta coded as in stream.py
+    index   file offset of every keyframe (4 bytes each)
+
+Frame 0 and every keyframe_every-th frame after it are KEY frames, so seek()
+only ever decodes up to keyframe_every - 1 deltas.
+"""
+
+import struct
+import utime
+from stream import apply_rle
+
+MAGIC = b"M7AN"
+VERSION = 1
+HEADER = "<4sBBHBBHII"
+HEADER_SIZE = 20
+
+KEY = 0
+ROWS = 1
+XOR = 2
+
+
+class Player:
+    def __init__(self, display, path):
+        self.display = display
+        self.file = open(path, "rb")
+        magic, version, height, width, fps, _, key_every, frames, index = struct.unpack(
+            HEADER, self.file.read(HEADER_SIZE))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("not an .anim file")
+        if width != display.width or height != display.height:
+            raise ValueError("animation is %dx%d, display is %dx%d" % (
+                width, height, display.width, display.height))
+        self.fps = fps
+        self.keyframe_every = key_every
+        self.frames = frames
+        self._index = index
+        self.position = 0  # Number of the next frame next() will show
+        self.stride = display.stride
+        self._frame = memoryview(display.buffer)
+        self._scratch = bytearray(len(display.buffer))
+        self._small = memoryview(bytearray(max(4, (height + 7) >> 3)))
+
+    def close(self):
+        self.file.close()
+
+    def _read(self, view):
+        if self.file.readinto(view) != len(view):
+            raise ValueError("truncated .anim file")
+
+    def next(self):
+        """Decode the next frame into display.buffer (no show). False after the last one."""
+        if self.position >= self.frames:
+            return False
+        small = self._small
+        self._read(small[:1])
+        kind = small[0]
+        if kind == KEY:
+            self._read(self._frame)
+        elif kind == ROWS:
+            mask_len = (self.display.height + 7) >> 3
+            mask = small[:mask_len]
+            self._read(mask)
+            stride = self.stride
+            for y in range(self.display.height):
+                if mask[y >> 3] & (1 << (y & 7)):
+                    self._read(self._frame[y * stride:(y + 1) * stride])
+        elif kind == XOR:
+            self._read(small[:2])
+            length = small[0] | (small[1] << 8)
+            self._read(memoryview(self._scratch)[:length])
+            if not apply_rle(self.display.buffer, self._scratch, length):
+                raise ValueError("bad delta in frame %d" % self.position)
+        else:
+            raise ValueError("bad record in frame %d" % self.position)
+        self.position += 1
+        return True
+
+    def seek(self, frame):
+        """Load frame into display.buffer: jump to its keyframe, then apply the deltas up to it."""
+        frame = min(max(frame, 0), self.frames - 1)
+        key = frame // self.keyframe_every
+        small = self._small
+        self.file.seek(self._index + 4 * key)
+        self._read(small[:4])
+        self.file.seek(small[0] | (small[1] << 8) | (small[2] << 16) | (small[3] << 24))
+        self.position = key * self.keyframe_every
+        while self.position <= frame:
+            self.next()
+
+    def play(self, loops=0, fps=None):
+        """Show the frames at fps (default: the file's), loops times (0 = forever)."""
+        period = 1000 // (fps or self.fps)
+        count = 0
+        deadline = utime.ticks_ms()
+        self.seek(0)
+        while True:
+            self.display.show()
+            deadline = utime.ticks_add(deadline, period)
+            wait = utime.ticks_diff(deadline, utime.ticks_ms())
+            if wait > 0:
+                utime.sleep_ms(wait)
+            else:
+                deadline = utime.ticks_ms()  # Running late, don't try to catch up
+            if not self.next():
+                count += 1
+                if loops and count >= loops:
+                    return
+                self.seek(0)
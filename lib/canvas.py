@@ -0,0 +1,103 @@
+"""
+One drawing surface spread over several MAX7219 chains.
+
+Every module added to a chain makes every row transaction longer, so long
+bars (or a 2U stack) are better split into several chains, each on its own
+SPI bus or its own CS pin.  Canvas gives them a single frame buffer with the
+usual framebuf drawing calls; show() copies each chain's region across and
+only flushes chains whose region changed, timing each one so module counts
+can be balanced.  It has the width, height, stride, buffer, brightness()
+and show() a Matrix8x8 has, so the lib effects, scenes, the compositor
+and the runtime draw on a Canvas the same way.
+"""
+
+import framebuf
+import utime
+
+
+class Canvas:
+    def __init__(self, chains):
+        """
+        chains: list of (display, x, y) where display is a Matrix8x8 and
+        x, y is the canvas pixel its first column/row lands on (multiples
+        of 8).  Chains may sit side by side, stacked, or both.
+        """
+        self.chains = []
+        width = height = 0
+        for display, x, y in chains:
+            if x & 7 or y & 7:
+                raise ValueError("Chain position must be a multiple of 8")
+            self.chains.append((display, x >> 3, y))
+            width = max(width, x + display.width)
+            height = max(height, y + display.height)
+        self.width = width
+        self.height = height
+        self.stride = width >> 3  # Bytes per canvas row
+        self.buffer = bytearray(self.stride * height)
+        fb = framebuf.FrameBuffer(self.buffer, width, height, framebuf.MONO_HLSB)
+        self.framebuf = fb
+        self.fill = fb.fill
+        self.pixel = fb.pixel
+        self.hline = fb.hline
+        self.vline = fb.vline
+        self.line = fb.line
+        self.rect = fb.rect
+        self.fill_rect = fb.fill_rect
+        self.text = fb.text
+        self.scroll = fb.scroll
+        self.blit = fb.blit
+        self._synced = False  # Nothing sent yet, so the first show() sends everything
+        count = len(self.chains)
+        self.flushes = [0] * count  # Times each chain was sent
+        self.last_us = [0] * count  # Transmit time of each chain's last flush
+        self.total_us = [0] * count
+
+    def brightness(self, value):
+        """Set global brightness (0-15) on every chain."""
+        for display, _, _ in self.chains:
+            display.brightness(value)
+
+    def show(self, force=False, modules=None):
+        """
+        Send every chain whose part of the canvas changed (all of them if
+        force).  modules: optional list of canvas byte columns that may have
+        changed (as from Compositor); chains outside them aren't checked.
+        """
+        force = force or not self._synced
+        src = self.buffer
+        stride = self.stride
+        for index, (display, col, top) in enumerate(self.chains):
+            span = display.stride
+            if not force and modules is not None:
+                for m in modules:
+                    if col <= m < col + span:
+                        break
+                else:
+                    continue
+            dst = display.buffer
+            changed = force
+            for y in range(display.height):
+                s = (top + y) * stride + col
+                d = y * span
+                for m in range(span):
+                    byte = src[s + m]
+                    if dst[d + m] != byte:
+                        dst[d + m] = byte
+                        changed = True
+            if not changed:
+                continue
+            start = utime.ticks_us()
+            display.show(force=force)
+            elapsed = utime.ticks_diff(utime.ticks_us(), start)
+            self.flushes[index] += 1
+            self.last_us[index] = elapsed
+            self.total_us[index] += elapsed
+        self._synced = True
+
+    def report(self):
+        """Print modules and average transmit time per chain."""
+        for index, (display, col, top) in enumerate(self.chains):
+            flushes = self.flushes[index]
+            average = self.total_us[index] // flushes if flushes else 0
+            print("chain %d at (%d, %d): %d modules, %d flushes, %d us avg, %d us last" % (
+                index, col * 8, top, display.num, flushes, average, self.last_us[index]))
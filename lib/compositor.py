@@ -0,0 +1,129 @@
+"""
+Sprites over a static background for the Matrix8x8 bar.
+
+Instead of clearing and redrawing the whole bar every frame, draw the
+still parts once into the background and the moving parts into sprites
+(small MONO_HLSB FrameBuffers with a position, z and visibility).
+show() works out which 8-column blocks (modules) a sprite left or entered
+and rebuilds just those: background bytes first, then the sprites touching
+them in z order.  The driver is told which modules changed so it only
+checks those.  A 2x3 paddle moving one pixel touches one or two modules.
+"""
+
+import framebuf
+
+
+class Sprite:
+    def __init__(self, width, height, x=0, y=0, z=0, visible=True, transparent=True):
+        """
+        Draw into sprite.fb (or sprite.buffer); after changing the picture
+        set sprite.changed = True.  transparent: unlit pixels show what is
+        underneath, otherwise the sprite covers its whole rectangle.
+        """
+        self.width = width
+        self.height = height
+        self.buffer = bytearray(((width + 7) >> 3) * height)
+        self.fb = framebuf.FrameBuffer(self.buffer, width, height, framebuf.MONO_HLSB)
+        self.x = x
+        self.y = y
+        self.z = z
+        self.visible = visible
+        self.key = 0 if transparent else -1
+        self.changed = True
+        self._drawn = None  # (x, y) last composited, None if not on screen
+
+    def move(self, x, y):
+        self.x = x
+        self.y = y
+
+
+class Compositor:
+    def __init__(self, display):
+        self.display = display
+        self.width = display.width
+        self.height = display.height
+        self.stride = display.stride
+        self.background = bytearray(len(display.buffer))
+        self.bg = framebuf.FrameBuffer(self.background, self.width, self.height, framebuf.MONO_HLSB)
+        # Sprites are blitted here, then only dirty blocks are copied out
+        self._work = bytearray(len(display.buffer))
+        self._fb = framebuf.FrameBuffer(self._work, self.width, self.height, framebuf.MONO_HLSB)
+        self.sprites = []
+        self._dirty = bytearray(self.stride)  # 1 = block needs rebuilding
+        self.invalidate()
+        self.frames = 0
+        self.blocks_composited = 0
+
+    def add(self, sprite):
+        """Put a sprite on the bar (kept sorted by z, lowest drawn first)."""
+        self.sprites.append(sprite)
+        self.sprites.sort(key=lambda s: s.z)
+        sprite._drawn = None
+        return sprite
+
+    def remove(self, sprite):
+        self.sprites.remove(sprite)
+        if sprite._drawn:
+            self._mark(sprite._drawn[0], sprite.width)
+
+    def invalidate(self, x=0, width=None):
+        """Rebuild columns x .. x + width - 1 on the next show() (default: all), e.g. after drawing on bg."""
+        self._mark(x, self.width if width is None else width)
+
+    def brightness(self, value):
+        self.display.brightness(value)
+
+    def _mark(self, x, width):
+        first = max(x, 0) >> 3
+        last = min(x + width - 1, self.width - 1) >> 3
+        dirty = self._dirty
+        for m in range(first, last + 1):
+            dirty[m] = 1
+
+    def _track(self):
+        """Mark the blocks every moved, changed, shown or hidden sprite covers, before and after."""
+        for sprite in self.sprites:
+            now = (sprite.x, sprite.y) if sprite.visible else None
+            if sprite.changed or sprite._drawn != now:
+                if sprite._drawn:
+                    self._mark(sprite._drawn[0], sprite.width)
+                if now:
+                    self._mark(sprite.x, sprite.width)
+                sprite._drawn = now
+                sprite.changed = False
+
+    def compose(self):
+        """Rebuild the dirty blocks in display.buffer. Returns the list of modules rebuilt."""
+        self._track()
+        dirty = self._dirty
+        blocks = [m for m in range(self.stride) if dirty[m]]
+        if not blocks:
+            return blocks
+        work = self._work
+        background = self.background
+        stride = self.stride
+        for m in blocks:
+            for i in range(m, len(work), stride):
+                work[i] = background[i]
+        for sprite in self.sprites:
+            if not sprite.visible:
+                continue
+            first = max(sprite.x, 0) >> 3
+            last = min(sprite.x + sprite.width - 1, self.width - 1) >> 3
+            for m in range(first, last + 1):
+                if dirty[m]:
+                    self._fb.blit(sprite.fb, sprite.x, sprite.y, sprite.key)
+                    break
+        buf = self.display.buffer
+        for m in blocks:
+            for i in range(m, len(buf), stride):
+                buf[i] = work[i]
+            dirty[m] = 0
+        self.blocks_composited += len(blocks)
+        return blocks
+
+    def show(self, force=False):
+        """compose() and send only the modules that changed."""
+        blocks = self.compose()
+        self.frames += 1
+        self.display.show(force=force, modules=blocks)
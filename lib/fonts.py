@@ -0,0 +1,106 @@
+"""
+Fonts for the Matrix8x8 bar.
+
+Font wraps either a module written by micropython-font-to-py
+(https://github.com/peterhinch/micropython-font-to-py) or a dict of column
+bytes like FONT_5x8 in scrolling_with_fonts.py ({char: [col0, col1, ...]},
+bit 0 = top row).  Glyphs can be any width.  Each glyph is converted once
+into a MONO_HLSB FrameBuffer and kept in a small LRU cache, so drawing a
+string is one blit per character.
+"""
+
+from collections import OrderedDict
+import framebuf
+from max7219 import reverse_bits
+
+
+class Font:
+    def __init__(self, source, height=8, cache_size=32, spacing=0, default=" "):
+        """
+        source: a font_to_py module or a dict of column bytes.
+        height: glyph height for dict fonts (font_to_py fonts know their own).
+        cache_size: max glyphs kept converted; lower it for big fonts.
+        spacing: blank columns added after every glyph.
+        default: dict fonts draw this char for anything missing.
+        """
+        self.source = source
+        self.is_dict = isinstance(source, dict)
+        self.height = height if self.is_dict else source.height()
+        self.cache_size = cache_size
+        self.spacing = spacing
+        self.default = default
+        self._cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def glyph(self, char):
+        """Return (FrameBuffer, width) for char, converting it on first use."""
+        cache = self._cache
+        if char in cache:
+            self.hits += 1
+            entry = cache.pop(char)  # Re-insert to mark as most recently used
+            cache[char] = entry
+            return entry
+        self.misses += 1
+        if self.is_dict:
+            entry = self._from_columns(char)
+        else:
+            entry = self._from_font_to_py(char)
+        if len(cache) >= self.cache_size:
+            del cache[next(iter(cache))]  # Evict the least recently used glyph
+        cache[char] = entry
+        return entry
+
+    def _from_columns(self, char):
+        columns = self.source.get(char)
+        if columns is None:
+            columns = self.source.get(self.default, ())
+        width = len(columns)
+        height = self.height
+        stride = (width + 7) >> 3
+        buf = bytearray(stride * height or 1)
+        for x in range(width):
+            bits = columns[x]
+            mask = 0x80 >> (x & 7)
+            for y in range(height):
+                if (bits >> y) & 1:
+                    buf[y * stride + (x >> 3)] |= mask
+        return framebuf.FrameBuffer(buf, width or 1, height, framebuf.MONO_HLSB), width
+
+    def _from_font_to_py(self, char):
+        src = self.source
+        data, height, width = src.get_ch(char)
+        stride = (width + 7) >> 3
+        buf = bytearray(stride * height or 1)
+        reverse = src.reverse()
+        if src.hmap():
+            # Horizontal mapping is already row-major, just fix the bit order
+            for i in range(stride * height):
+                b = data[i]
+                buf[i] = reverse_bits(b) if reverse else b
+        else:
+            # Vertical mapping: (height + 7) // 8 bytes per column
+            col_bytes = (height + 7) >> 3
+            for x in range(width):
+                mask = 0x80 >> (x & 7)
+                for y in range(height):
+                    bit = (7 - (y & 7)) if reverse else (y & 7)
+                    if (data[x * col_bytes + (y >> 3)] >> bit) & 1:
+                        buf[y * stride + (x >> 3)] |= mask
+        return framebuf.FrameBuffer(buf, width or 1, height, framebuf.MONO_HLSB), width
+
+    def width(self, text):
+        """Width of text in pixels, including spacing."""
+        total = 0
+        for char in text:
+            total += self.glyph(char)[1] + self.spacing
+        return total
+
+    def text(self, target, text, x, y=0):
+        """Draw text into target (display or FrameBuffer); returns the x after it."""
+        for char in text:
+            fb, width = self.glyph(char)
+            if width and x + width > 0:
+                target.blit(fb, x, y)
+            x += width + self.spacing
+        return x
@@ -0,0 +1,74 @@
+"""
+Cache of whole rendered frames, keyed by whatever the picture depends on.
+
+Effects like the road in pole_position.py draw the same few dozen frames
+over and over.  FrameCache keeps the packed buffers it has seen, up to a
+byte budget, and puts a cached one back into display.buffer with a single
+copy instead of drawing it again.  The least recently used frame makes room
+for a new one (its buffer is reused, so a full cache stops allocating).
+"""
+
+from collections import OrderedDict
+
+
+class FrameCache:
+    def __init__(self, display, budget=4096):
+        """
+        budget: bytes of frame data to keep (each frame is len(display.buffer)
+        bytes, plus a few dozen bytes of bookkeeping not counted here).
+        """
+        self.display = display
+        self.frame_size = len(display.buffer)
+        self.capacity = max(1, budget // self.frame_size)  # Frames that fit
+        self._frames = OrderedDict()
+        self._view = memoryview(display.buffer)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.prewarmed = 0  # Frames rendered by prewarm() (not counted as misses)
+
+    def draw(self, key, render):
+        """Put the frame for key into display.buffer, calling render(key) to draw it if not cached."""
+        frames = self._frames
+        if key in frames:
+            self.hits += 1
+            frame = frames.pop(key)  # Re-insert to mark as most recently used
+            frames[key] = frame
+            self._view[:] = frame
+            return
+        self.misses += 1
+        render(key)
+        if len(frames) >= self.capacity:
+            frame = frames.pop(next(iter(frames)))  # Recycle the least recently used
+            frame[:] = self._view
+            self.evictions += 1
+        else:
+            frame = bytearray(self._view)
+        frames[key] = frame
+
+    def prewarm(self, keys, render):
+        """Render keys up front (at most capacity of them), e.g. at startup. Leaves the display cleared."""
+        misses = self.misses
+        for key in keys:
+            if len(self._frames) >= self.capacity:
+                break
+            self.draw(key, render)
+        self.prewarmed += self.misses - misses
+        self.misses = misses
+        self.display.fill(0)
+
+    def clear(self):
+        self._frames = OrderedDict()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "frames": len(self._frames),
+            "capacity": self.capacity,
+            "bytes": len(self._frames) * self.frame_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "prewarmed": self.prewarmed,
+            "hit_rate": self.hits * 100 // lookups if lookups else 0,
+        }
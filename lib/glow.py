@@ -0,0 +1,77 @@
+"""
+Hardware brightness effects for the Matrix8x8 bar.
+
+The MAX7219 has an intensity register in every module, and
+Matrix8x8.brightness_per_module() can give each module its own value in a
+single transaction.  Glow builds gradients, fades and a glow that follows a
+moving column (KITT, sonar) from that, so brightness changes cost no
+per-pixel work at all.  Levels here are perceptual 0-31, mapped through
+max7219.GAMMA to the 16 register steps.
+"""
+
+
+class Glow:
+    def __init__(self, display, floor=0, peak=31):
+        self.display = display
+        self.num = display.num
+        self.floor = floor  # Dimmest level used by follow()
+        self.peak = peak  # Brightest level used by follow()
+        self.levels = bytearray(self.num)  # Perceptual level of each module
+        self._target = bytearray(self.num)  # Where step() is fading to
+        self._scratch = bytearray(self.num)
+        self._sent = False  # Nothing sent yet
+
+    def apply(self, levels):
+        """Show these perceptual levels (one per module) now, cancelling any fade."""
+        self.fade_to(levels)
+        self._send(self._target)
+
+    def _send(self, levels):
+        current = self.levels
+        changed = not self._sent
+        for m in range(self.num):
+            if current[m] != levels[m]:
+                current[m] = levels[m]
+                changed = True
+        if changed:  # Unchanged levels cost nothing on the bus
+            self.display.brightness_per_module(current, gamma=True)
+            self._sent = True
+
+    def gradient(self, start, end):
+        """Even ramp from start (first module) to end (last module)."""
+        last = max(self.num - 1, 1)
+        self.apply([start + (end - start) * m // last for m in range(self.num)])
+
+    def follow(self, x, spread=3):
+        """Brightest around column x, dimming to floor over spread modules either side."""
+        peak = self.peak
+        drop = peak - self.floor
+        span = spread * 16  # In half-pixels
+        levels = self._scratch
+        for m in range(self.num):
+            distance = abs(2 * x - (16 * m + 7))  # Half-pixels from x to the module centre
+            levels[m] = max(self.floor, peak - drop * distance // span)
+        self.apply(levels)
+
+    def fade_to(self, levels):
+        """Set the levels step() fades towards."""
+        for m in range(self.num):
+            self._target[m] = min(max(levels[m], 0), 31)
+
+    def step(self, amount=1):
+        """Move every module up to amount levels towards the fade target. Returns True while fading."""
+        target = self._target
+        levels = self._scratch
+        fading = False
+        for m in range(self.num):
+            value = self.levels[m]
+            goal = target[m]
+            if value < goal:
+                value = min(value + amount, goal)
+            elif value > goal:
+                value = max(value - amount, goal)
+            levels[m] = value
+            if value != goal:
+                fading = True
+        self._send(levels)
+        return fading
@@ -0,0 +1,101 @@
+"""
+Physical module layouts for Matrix8x8.
+
+Cheap 7219 boards are not all mounted the same way: some are rotated, some
+mirrored, and a bar can be built as two rows with the chain snaking back
+(serpentine).  A Layout describes where each module of the chain sits on a
+2D canvas and how it is turned.  It is compiled once into a small plan per
+module (which canvas bytes to read, whether to transpose / reverse rows /
+reverse bits) so show() only does a table-driven 8x8 repack per module and
+drawing code never has to think about orientation.
+
+    from layout import Layout, serpentine
+    lay = serpentine(6, 2)           # 12 modules, 48x16, second row upside down
+    display = max7219.Matrix8x8(spi, cs, 12, layout=lay)
+"""
+
+from max7219 import reverse_bits, transpose8
+
+_REVERSE = bytes(reverse_bits(b) for b in range(256))  # Bit-reversed value of every byte
+
+# (rotation, flip) -> (read rows bottom-up, transpose, write rows bottom-up, reverse bits)
+# rotation is how far the module is turned clockwise from the normal mount,
+# flip mirrors it left to right (applied before the rotation).
+_PLANS = {
+    (0, False): (False, False, False, False),
+    (0, True): (False, False, False, True),
+    (90, False): (True, True, False, False),
+    (90, True): (False, True, False, False),
+    (180, False): (True, False, False, True),
+    (180, True): (True, False, False, False),
+    (270, False): (False, True, True, False),
+    (270, True): (True, True, True, False),
+}
+
+
+class Layout:
+    def __init__(self, width, height, modules):
+        """
+        width, height: canvas size in pixels (multiples of 8).
+        modules: one (x, y, rotation, flip) per module in the order show()
+        sends them (module 0 normally shows columns 0-7).  x, y is the
+        canvas position of the module's 8x8 tile (multiples of 8),
+        rotation is 0, 90, 180 or 270 degrees clockwise.
+        """
+        if width & 7 or height & 7:
+            raise ValueError("Canvas size must be a multiple of 8")
+        self.width = width
+        self.height = height
+        self.num = len(modules)
+        stride = width >> 3
+        self._plan = []
+        for x, y, rotation, flip in modules:
+            if x & 7 or y & 7 or not (0 <= x < width and 0 <= y < height):
+                raise ValueError("Bad module position (%d, %d)" % (x, y))
+            key = (rotation % 360, bool(flip))
+            if key not in _PLANS:
+                raise ValueError("Rotation must be 0, 90, 180 or 270")
+            rows_up, transpose, out_up, reverse = _PLANS[key]
+            offsets = bytearray(8)  # Canvas row of each block byte, relative
+            for r in range(8):
+                offsets[r] = 7 - r if rows_up else r
+            base = y * stride + (x >> 3)
+            self._plan.append((base, offsets, transpose, out_up, reverse))
+        self._stride = stride
+        self._block = bytearray(8)
+
+    def pack(self, src, dst):
+        """Repack canvas buffer src into chain-order rows in dst (8 * num bytes)."""
+        num = self.num
+        stride = self._stride
+        block = self._block
+        rev = _REVERSE
+        for m in range(num):
+            base, offsets, transpose, out_up, reverse = self._plan[m]
+            for r in range(8):
+                block[r] = src[base + offsets[r] * stride]
+            if transpose:
+                transpose8(block)
+            for r in range(8):
+                byte = block[7 - r if out_up else r]
+                dst[r * num + m] = rev[byte] if reverse else byte
+
+
+def strip(num, rotation=0, flip=False):
+    """A plain row of num modules all mounted the same way."""
+    return Layout(8 * num, 8, [(8 * m, 0, rotation, flip) for m in range(num)])
+
+
+def serpentine(columns, rows, rotation=0):
+    """
+    columns x rows modules where the chain runs left to right along the
+    first row, then back right to left along the next one, and so on.
+    Every other row is mounted upside down (180 degrees on top of rotation).
+    """
+    modules = []
+    for row in range(rows):
+        order = range(columns) if row % 2 == 0 else range(columns - 1, -1, -1)
+        turn = rotation if row % 2 == 0 else (rotation + 180) % 360
+        for col in order:
+            modules.append((8 * col, 8 * row, turn, False))
+    return Layout(8 * columns, 8 * rows, modules)
@@ -1,4 +1,6 @@
 from micropython import const
+from machine import Timer
+import _thread
 import framebuf
 import utime
 
@@ -10,21 +12,136 @@ _SCANLIMIT = const(11)
 _SHUTDOWN = const(12)
 _DISPLAYTEST = const(15)
 
+# Binary code modulation: which bit-plane to show in each of the 15 PWM
+# subframes.  Plane p is on screen for 2**p subframes, so a pixel at level
+# L is lit for exactly L of 15 subframes, the same duty as a threshold PWM.
+_BCM_PLANE = b"\x00\x01\x01\x02\x02\x02\x02\x03\x03\x03\x03\x03\x03\x03\x03"
+
+# Perceptual brightness 0-31 -> intensity register 0-15 (gamma 2.2).  The
+# register steps are linear in LED current, which the eye sees as bunched
+# up at the bright end.  Register 0 is the dimmest setting, not off.
+GAMMA = bytes((0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 3, 3,
+               4, 4, 5, 5, 6, 6, 7, 8, 9, 9, 10, 11, 12, 13, 14, 15))
+
+# _GS4_BITS[p][b]: bit p of the two 4-bit pixels in GS4 byte b, as 2 bits
+# (left pixel high), ready to be packed four at a time into an HLSB byte.
+# Built by the first commit(), so mono displays never pay for it at boot.
+_GS4_BITS = None
+
+
+def _gs4_bits():
+    global _GS4_BITS
+    if _GS4_BITS is None:
+        _GS4_BITS = [
+            bytes((((b >> (4 + p)) & 1) << 1) | ((b >> p) & 1) for b in range(256))
+            for p in range(4)
+        ]
+    return _GS4_BITS
+
+
+def reverse_bits(b):
+    """Mirror a byte: bit 7 <-> bit 0, 6 <-> 1 and so on."""
+    b = ((b & 0xF0) >> 4) | ((b & 0x0F) << 4)
+    b = ((b & 0xCC) >> 2) | ((b & 0x33) << 2)
+    return ((b & 0xAA) >> 1) | ((b & 0x55) << 1)
+
+
+def transpose8(b):
+    """Transpose an 8x8 bit matrix in place: bit j of b[i] <-> bit i of b[j]."""
+    # Swap 4x4, then 2x2, then 1x1 blocks; every value stays a small int
+    for i in (0, 1, 2, 3):
+        t = ((b[i] >> 4) ^ b[i + 4]) & 0x0F
+        b[i + 4] ^= t
+        b[i] ^= t << 4
+    for i in (0, 1, 4, 5):
+        t = ((b[i] >> 2) ^ b[i + 2]) & 0x33
+        b[i + 2] ^= t
+        b[i] ^= t << 2
+    for i in (0, 2, 4, 6):
+        t = ((b[i] >> 1) ^ b[i + 1]) & 0x55
+        b[i + 1] ^= t
+        b[i] ^= t << 1
+
+
 class Matrix8x8:
-    def __init__(self, spi, cs, num, brightness_mode=False):
+    def __init__(self, spi, cs, num, brightness_mode=False, layout=None):
         """
         MAX7219 Driver for 8x8 LED matrices.
         
         brightness_mode=True enables per-pixel brightness simulation (via PWM).
+        layout: a layout.Layout for rotated, mirrored or stacked modules;
+        the buffer is then layout.width x layout.height and show() repacks
+        it into chain order.
         """
         self.spi = spi
         self.cs = cs
         self.cs.init(cs.OUT, True)
-        self.buffer = bytearray(8 * num)
-        self.brightness_buffer = [[15 for _ in range(8 * num)] for _ in range(8)]  # Per-pixel brightness
+        self._layout = layout
+        if layout is None:
+            width, height = 8 * num, 8
+        else:
+            if brightness_mode:
+                raise ValueError("Layouts need mono mode")
+            if layout.num != num:
+                raise ValueError("Layout is for %d modules" % layout.num)
+            width, height = layout.width, layout.height
+            self._packed = bytearray(8 * num)  # Buffer repacked into chain order
+        self.width = width
+        self.height = height
+        self.stride = width >> 3  # Bytes per buffer row
+        self.buffer = bytearray(self.stride * height)
         self.num = num
         self.brightness_mode = brightness_mode  # Enable brightness simulation?
-        fb = framebuf.FrameBuffer(self.buffer, 8 * num, 8, framebuf.MONO_HLSB)
+        # Per-pixel brightness: one nibble per pixel, drawable with every
+        # framebuf primitive through self.grey (colour = level 0-15).
+        # Allocated by _init_grey(), so mono displays don't carry them.
+        self.grey_buffer = None
+        self.grey = None
+        # Lit pixels of the mono buffer are shown at this level on top of
+        # the grey levels (None shows the grey levels only)
+        self.mono_level = 15
+        # Grey + mono packed as 4 bit-planes in the same HLSB layout as
+        # self.buffer; rebuilt by commit()
+        self._planes = None
+        self._grey_dirty = True  # set_pixel_brightness() since the last pack
+        if brightness_mode:
+            self._init_grey()
+        # Background refresh state (see start_refresh)
+        self._timer = None
+        self._front = None  # Planes the timer is displaying
+        self._spare = None  # Planes commit() fills before swapping
+        self._slot = 0
+        self._busy = False  # A register write is on the bus, the refresh tick must wait
+        self.refresh_hz = 0  # Measured greyscale frames (15 subframes) per second
+        self.refresh_overruns = 0  # Subframes that ran late or took longer than the period
+        # Dual-core pipeline state (see start_pipeline)
+        self._lock = None  # Guards the front buffer
+        self._bus = None  # Guards SPI, CS and the byte/row counters between the cores
+        self._front_buffer = None  # Last frame handed over by show()
+        self._pending = False  # Front buffer holds a frame core 1 hasn't taken yet
+        self._pipeline = False
+        self._tx_running = False
+        self.frames_dropped = 0  # Frames replaced by a newer show() before being sent
+        # Preallocated transmit buffers: one (register, data) pair per module.
+        # The register bytes are laid out once here, show() only refills data.
+        self._rows = []
+        for y in range(8):
+            row = bytearray(2 * num)
+            for m in range(num):
+                row[2 * m] = _DIGIT0 + y
+            self._rows.append(row)
+        self._cmd = bytearray(2 * num)  # Register broadcasts from init()/brightness()
+        self._block = bytearray(8)  # Scratch 8x8 block for write_columns()/read_columns()
+        # Copy of the digit bytes last sent, so unchanged rows can be skipped
+        self._shadow = bytearray(8 * num)
+        self._synced = False  # Shadow matches the chip? init() sends the first frame
+        self.rows_sent = 0
+        self.rows_skipped = 0
+        self.bytes_sent = 0
+        # show() timing, off unless enable_stats() is called
+        self._stats = False
+        self.reset_stats()
+        fb = framebuf.FrameBuffer(self.buffer, width, height, framebuf.MONO_HLSB)
         self.framebuf = fb
         self.fill = fb.fill
         self.pixel = fb.pixel
@@ -38,21 +155,53 @@ class Matrix8x8:
         self.blit = fb.blit
         self.init()
 
-    def _write(self, command, data):
-        self.cs(0)
+    def _bus_begin(self):
+        """Claim the bus for a register write (see _refresh_tick and _tx_loop)."""
+        self._busy = True
+        if self._bus is not None:
+            self._bus.acquire()
+
+    def _bus_end(self):
+        if self._bus is not None:
+            self._bus.release()
+        self._busy = False
+
+    def _set_cmd(self, command, data):
+        cmd = self._cmd
         for m in range(self.num):
-            self.spi.write(bytearray([command, data]))
+            cmd[2 * m] = command
+            cmd[2 * m + 1] = data
+
+    def _put_cmd(self):
+        """Send self._cmd as one transaction; the bus must be claimed."""
+        self.cs(0)
+        self.spi.write(self._cmd)
         self.cs(1)
+        self.bytes_sent += len(self._cmd)
+
+    def _write(self, command, data):
+        """Send the same register write to every module in one transaction."""
+        self._bus_begin()
+        self._set_cmd(command, data)
+        self._put_cmd()
+        self._bus_end()
 
     def init(self):
+        self._bus_begin()
         for command, data in (
             (_SHUTDOWN, 0),
             (_DISPLAYTEST, 0),
             (_SCANLIMIT, 7),
             (_DECODEMODE, 0),
-            (_SHUTDOWN, 1),
         ):
-            self._write(command, data)
+            self._set_cmd(command, data)
+            self._put_cmd()
+        # Load the digit registers while still shut down, so the random
+        # power-up contents never light up
+        self._send(self._frame(), True)
+        self._set_cmd(_SHUTDOWN, 1)
+        self._put_cmd()
+        self._bus_end()
 
     def brightness(self, value):
         """Set global brightness (0-15)."""
@@ -60,28 +209,420 @@ class Matrix8x8:
             raise ValueError("Brightness out of range")
         self._write(_INTENSITY, value)
 
+    def brightness_per_module(self, levels, gamma=False):
+        """
+        Set each module's intensity in one transaction: levels[m] (0-15)
+        goes to module m, in the order show() sends them.  With gamma=True
+        the levels are perceptual 0-31, mapped through GAMMA.
+        """
+        if len(levels) != self.num:
+            raise ValueError("Need one level per module")
+        cmd = self._cmd
+        for m in range(self.num):
+            value = levels[m]
+            if gamma:
+                value = GAMMA[min(max(value, 0), 31)]
+            elif not 0 <= value <= 15:
+                raise ValueError("Brightness out of range")
+            cmd[2 * m] = _INTENSITY
+            cmd[2 * m + 1] = value
+        self._bus_begin()
+        self._put_cmd()
+        self._bus_end()
+
+    def write_columns(self, x, data):
+        """
+        Write column bytes starting at column x (bit 0 = top row), the
+        layout of FONT_5x8 and most bar/wave data.  Works 8 columns at a
+        time with a bitwise transpose; x need not be a multiple of 8 and
+        anything off the edge is clipped.
+        """
+        block = self._block
+        n = len(data)
+        for start in range(0, n, 8):
+            count = min(8, n - start)
+            # Reversed, so the transpose puts the first column in the MSB
+            for k in range(8):
+                block[7 - k] = data[start + k] if k < count else 0
+            transpose8(block)
+            self._put_rows(x + start, block, (0xFF00 >> count) & 0xFF)
+
+    def read_columns(self, x, n):
+        """Return n column bytes starting at column x (bit 0 = top row)."""
+        block = self._block
+        out = bytearray(n)
+        for start in range(0, n, 8):
+            count = min(8, n - start)
+            self._get_rows(x + start, block)
+            transpose8(block)
+            for k in range(count):
+                out[start + k] = block[7 - k]
+        return out
+
+    def _put_rows(self, x, rows, mask):
+        """Write 8 row bytes (MSB = column x) into the buffer, only the bits in mask."""
+        stride = self.stride
+        buf = self.buffer
+        i = x >> 3
+        shift = x & 7
+        for y in range(8):
+            bits = rows[y] & mask
+            base = y * stride
+            if 0 <= i < stride:
+                m = mask >> shift
+                buf[base + i] = (buf[base + i] & ~m) | (bits >> shift)
+            if shift and 0 <= i + 1 < stride:
+                m = (mask << (8 - shift)) & 0xFF
+                buf[base + i + 1] = (buf[base + i + 1] & ~m) | ((bits << (8 - shift)) & 0xFF)
+
+    def _get_rows(self, x, rows):
+        """Read the 8 row bytes whose MSB is column x (off-screen reads as 0)."""
+        stride = self.stride
+        buf = self.buffer
+        i = x >> 3
+        shift = x & 7
+        for y in range(8):
+            base = y * stride
+            byte = (buf[base + i] << shift) & 0xFF if 0 <= i < stride else 0
+            if shift and 0 <= i + 1 < stride:
+                byte |= buf[base + i + 1] >> (8 - shift)
+            rows[y] = byte
+
+    def _init_grey(self):
+        """Allocate the grey buffer (all pixels at 15) and the bit-planes, once."""
+        if self.grey is not None:
+            return
+        self.grey_buffer = bytearray((self.width * self.height) >> 1)
+        self.grey = framebuf.FrameBuffer(
+            self.grey_buffer, self.width, self.height, framebuf.GS4_HMSB)
+        self.grey.fill(15)
+        self._planes = [bytearray(8 * self.num) for _ in range(4)]
+
     def set_pixel_brightness(self, x, y, brightness):
         """Set individual pixel brightness (0-15)."""
         if not (0 <= brightness <= 15):
             brightness = 15  # Default to max if out of range
-        self.brightness_buffer[y][x] = brightness
+        self._init_grey()
+        self.grey.pixel(x, y, brightness)
+        self._grey_dirty = True
+
+    def show(self, pwm_frame=0, force=False, modules=None):
+        """
+        Render frame, applying brightness simulation if enabled.
+
+        In brightness_mode, pwm_frame (0-14) picks the subframe: the
+        matching bit-plane is sent, so cycling pwm_frame through 0-14
+        displays each pixel for its level out of 15 subframes.  Levels
+        from set_pixel_brightness() are picked up automatically; after
+        drawing with self.grey or the mono primitives call commit().  With
+        start_refresh() running, show() just commits the new levels, and
+        with start_pipeline() running it just queues the frame for core 1.
+
+        Rows whose bytes match what was last sent are skipped;
+        force=True retransmits all 8 rows.  modules: optional list of the
+        modules (8-column blocks of the buffer) that changed since the last
+        show(); only those are checked, e.g. from compositor.Compositor.
+        Ignored with a layout or in brightness_mode.
+        """
+        if not self._stats:
+            self._show(pwm_frame, force, modules)
+            return
+        start = utime.ticks_us()
+        self._show(pwm_frame, force, modules)
+        elapsed = utime.ticks_diff(utime.ticks_us(), start)
+        self.frames_shown += 1
+        self._show_total_us += elapsed
+        if elapsed > self._show_max_us:
+            self._show_max_us = elapsed
+        if self._show_min_us < 0 or elapsed < self._show_min_us:
+            self._show_min_us = elapsed
+
+    def _show(self, pwm_frame, force, modules=None):
+        if self._pipeline:
+            # Core 1 does the SPI work, hand the frame over and return
+            with self._lock:
+                if self._pending:
+                    self.frames_dropped += 1
+                self._front_buffer[:] = self._frame()
+                self._pending = True
+            return
+        if self.brightness_mode:
+            if self._timer is not None:
+                # The refresh timer owns the bus, just hand it the new levels
+                self.commit()
+                return
+            if self._grey_dirty:
+                self.commit()
+            self._send(self._planes[_BCM_PLANE[pwm_frame % 15]], force)
+        else:
+            self._send(self._frame(), force, modules if self._layout is None else None)
+
+    def enable_stats(self, on=True):
+        """Start (or stop) timing every show(); see stats()."""
+        self._stats = on
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.frames_shown = 0
+        self._bus_begin()
+        self.bytes_sent = 0
+        self.rows_sent = 0
+        self.rows_skipped = 0
+        self._bus_end()
+        self._show_total_us = 0
+        self._show_min_us = -1
+        self._show_max_us = 0
+        self._stats_start = utime.ticks_ms()
+
+    def stats(self):
+        """Counters since enable_stats()/reset_stats() as a dict."""
+        frames = self.frames_shown
+        elapsed = utime.ticks_diff(utime.ticks_ms(), self._stats_start)
+        self._bus_begin()
+        sent = (self.bytes_sent, self.rows_sent, self.rows_skipped)
+        self._bus_end()
+        return {
+            "frames": frames,
+            "bytes": sent[0],
+            "rows_sent": sent[1],
+            "rows_skipped": sent[2],
+            "show_us_min": max(self._show_min_us, 0),
+            "show_us_avg": self._show_total_us // frames if frames else 0,
+            "show_us_max": self._show_max_us,
+            "fps": frames * 1000 // elapsed if elapsed > 0 else 0,
+        }
+
+    def calibrate_spi(self, baudrates=(1000000, 2000000, 5000000, 8000000, 10000000), frames=50):
+        """
+        Time full-frame show()s at each SPI baudrate and print the frame
+        rate the chain reaches.  The MAX7219 is rated for 10 MHz.  Returns
+        a list of (requested baudrate, actual baudrate, fps) and leaves the
+        bus at the last rate tried; spi.init(baudrate=...) the one you pick.
+        """
+        results = []
+        for baudrate in baudrates:
+            self.spi.init(baudrate=baudrate)
+            actual = baudrate
+            text = repr(self.spi)  # rp2 reports the rate its divider really gives
+            if "baudrate=" in text:
+                digits = text.split("baudrate=")[1].split(",")[0].split(")")[0]
+                if digits.isdigit():
+                    actual = int(digits)
+            start = utime.ticks_us()
+            for _ in range(frames):
+                self._show(0, True)
+            elapsed = utime.ticks_diff(utime.ticks_us(), start)
+            fps = frames * 1000000 // elapsed if elapsed > 0 else 0
+            print("SPI %8d Hz (actual %8d): %5d fps, %d us per frame" % (
+                baudrate, actual, fps, elapsed // frames))
+            results.append((baudrate, actual, fps))
+        return results
+
+    def save_frame(self, path):
+        """Write the mono buffer to flash, for load_frame() at the next boot."""
+        with open(path, "wb") as f:
+            f.write(self.buffer)
+
+    def load_frame(self, path):
+        """Read a buffer written by save_frame(). False (and a blank buffer) if it's missing or the wrong size."""
+        try:
+            with open(path, "rb") as f:
+                if f.readinto(self.buffer) == len(self.buffer) and not f.read(1):
+                    return True
+        except OSError:
+            pass
+        self.fill(0)
+        return False
+
+    def _frame(self):
+        """The mono frame in chain order, repacked through the layout if there is one."""
+        if self._layout is None:
+            return self.buffer
+        self._layout.pack(self.buffer, self._packed)
+        return self._packed
 
-    def show(self, pwm_frame=0):
-        """Render frame, applying brightness simulation if enabled."""
+    def _send(self, buf, force=False, modules=None):
+        """Transmit buf (HLSB rows, 8 * num bytes), skipping unchanged rows."""
+        num = self.num
+        shadow = self._shadow
+        force = force or not self._synced
+        if force:
+            modules = None
         for y in range(8):
+            row = self._rows[y]
+            base = y * num
+            dirty = force
+            if modules is None:
+                # Literal range() in the for: no range object on the heap
+                for m in range(num):
+                    byte = buf[base + m]
+                    row[2 * m + 1] = byte
+                    if shadow[base + m] != byte:
+                        shadow[base + m] = byte
+                        dirty = True
+            else:
+                for m in modules:
+                    byte = buf[base + m]
+                    row[2 * m + 1] = byte
+                    if shadow[base + m] != byte:
+                        shadow[base + m] = byte
+                        dirty = True
+            if not dirty:
+                self.rows_skipped += 1
+                continue
             self.cs(0)
-            for m in range(self.num):
-                byte = 0
-                for bit in range(8):
-                    x = (m * 8) + bit
-                    if self.brightness_mode:
-                        # Apply software PWM to simulate brightness
-                        if self.brightness_buffer[y][x] > pwm_frame:
-                            byte |= (1 << bit)
-                    else:
-                        # Default binary display
-                        if self.buffer[(y * self.num) + m] & (1 << bit):
-                            byte |= (1 << bit)
-                self.spi.write(bytearray([_DIGIT0 + y, byte]))
+            self.spi.write(row)
             self.cs(1)
+            self.rows_sent += 1
+            self.bytes_sent += len(row)
+        self._synced = True
+
+    def commit(self):
+        """
+        Pack the grey levels, with lit mono pixels on top at mono_level,
+        into the bit-planes show() and the background refresh send.
+        """
+        self._init_grey()
+        self._grey_dirty = False
+        spare = self._spare
+        if spare is None:
+            self._pack(self._planes)
+            return
+        self._pack(spare)
+        # A single attribute store, so the timer never sees half a frame
+        self._front, self._spare = spare, self._front
+
+    def _pack(self, planes):
+        grey = self.grey_buffer
+        mono = self.buffer
+        level = self.mono_level
+        t0, t1, t2, t3 = _gs4_bits()
+        p0, p1, p2, p3 = planes
+        # Each HLSB byte is 8 pixels = 4 GS4 bytes
+        for i in range(len(mono)):
+            g = i << 2
+            a = grey[g]
+            b = grey[g + 1]
+            c = grey[g + 2]
+            d = grey[g + 3]
+            p0[i] = (t0[a] << 6) | (t0[b] << 4) | (t0[c] << 2) | t0[d]
+            p1[i] = (t1[a] << 6) | (t1[b] << 4) | (t1[c] << 2) | t1[d]
+            p2[i] = (t2[a] << 6) | (t2[b] << 4) | (t2[c] << 2) | t2[d]
+            p3[i] = (t3[a] << 6) | (t3[b] << 4) | (t3[c] << 2) | t3[d]
+        if level is None:
+            return
+        # Mono over grey: lit mono pixels take mono_level's bits
+        for p in range(4):
+            plane = planes[p]
+            on = (level >> p) & 1
+            for i in range(len(mono)):
+                m = mono[i]
+                if m:
+                    plane[i] = (plane[i] | m) if on else (plane[i] & ~m)
+
+    def start_refresh(self, freq=1500, timer_id=-1):
+        """
+        Cycle the greyscale subframes from a timer at freq subframes/second.
+
+        The app then just draws levels and calls commit() (or show());
+        refresh_hz and refresh_overruns report how well the Pico keeps up.
+        """
+        if not self.brightness_mode:
+            raise ValueError("Refresh needs brightness_mode")
+        self.stop_refresh()
+        size = 8 * self.num
+        self._front = [bytearray(size) for _ in range(4)]
+        self._spare = [bytearray(size) for _ in range(4)]
+        self.commit()
+        self._slot = 0
+        self._period_us = 1000000 // freq
+        self._last_tick = self._cycle_start = utime.ticks_us()
+        self.refresh_hz = 0
+        self.refresh_overruns = 0
+        self._timer = Timer(timer_id)
+        # Soft callback: it runs between bytecodes of the main program, so
+        # it can land inside a register write; _busy makes it skip that tick
+        self._timer.init(mode=Timer.PERIODIC, freq=freq, callback=self._refresh_tick, hard=False)
+
+    def stop_refresh(self):
+        """Stop the background refresh; show(pwm_frame) drives the display again."""
+        if self._timer is not None:
+            self._timer.deinit()
+            self._timer = None
+            # commit() only packed into the timer's planes meanwhile; keep
+            # the last picture for show(pwm_frame)
+            for plane, front in zip(self._planes, self._front):
+                plane[:] = front
+            self._front = self._spare = None
+
+    def _refresh_tick(self, timer):
+        front = self._front
+        if front is None:
+            return  # Scheduled just before stop_refresh()
+        if self._busy:
+            return  # Don't split a register write; this subframe runs next tick
+        start = utime.ticks_us()
+        slot = self._slot
+        self._send(front[_BCM_PLANE[slot]])
+        end = utime.ticks_us()
+        period = self._period_us
+        if (utime.ticks_diff(start, self._last_tick) > period + (period >> 1)
+                or utime.ticks_diff(end, start) > period):
+            self.refresh_overruns += 1
+        self._last_tick = start
+        slot += 1
+        if slot == 15:
+            slot = 0
+            elapsed = utime.ticks_diff(start, self._cycle_start)
+            if elapsed > 0:
+                self.refresh_hz = 1000000 // elapsed
+            self._cycle_start = start
+        self._slot = slot
+
+    def start_pipeline(self):
+        """
+        Move SPI transmission to the second core.
+
+        show() then copies the drawing buffer into a front buffer under a
+        lock and returns, while core 1 sends it and core 0 draws the next
+        frame.  The drawing buffer keeps its contents exactly as in
+        synchronous mode.  frames_dropped counts frames that were replaced
+        before core 1 got to them.  Register writes (brightness(), init())
+        wait for core 1 to finish the frame it is sending.
+        """
+        if self.brightness_mode:
+            raise ValueError("Pipeline needs mono mode")
+        if self._pipeline:
+            return
+        if self._lock is None:
+            self._lock = _thread.allocate_lock()
+            self._bus = _thread.allocate_lock()
+            self._front_buffer = bytearray(8 * self.num)
+            self._tx_buffer = bytearray(8 * self.num)
+        self._pending = False
+        self.frames_dropped = 0
+        self._pipeline = True
+        self._tx_running = True
+        _thread.start_new_thread(self._tx_loop, ())
+
+    def stop_pipeline(self):
+        """Send any queued frame, stop core 1 and go back to synchronous show()."""
+        if not self._pipeline:
+            return
+        self._pipeline = False
+        while self._tx_running:
+            utime.sleep_ms(1)
 
+    def _tx_loop(self):
+        lock = self._lock
+        tx = self._tx_buffer
+        while self._pipeline or self._pending:
+            if not self._pending:
+                utime.sleep_us(100)
+                continue
+            with lock:
+                tx[:] = self._front_buffer
+                self._pending = False
+            with self._bus:
+                self._send(tx)
+        self._tx_running = False
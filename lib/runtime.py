@@ -0,0 +1,115 @@
+"""
+asyncio runtime for the Matrix8x8 bar.
+
+Animations are coroutines that draw a frame and then `await rt.frame()`,
+which shows it and sleeps until the next frame deadline (ticks_ms based,
+kept per task, missed deadlines are counted rather than bursting to catch
+up).  Long pauses use `await rt.pause(ms)` so nothing else freezes, and a
+command task reads lines like "brightness 3" from the USB serial port
+while the animation runs.
+
+    rt = Runtime(display, frame_ms=100)
+    rt.command("speed", set_speed)
+    rt.run(animation(rt))
+"""
+
+import sys
+import utime
+
+try:
+    import asyncio
+except ImportError:
+    import uasyncio as asyncio
+
+
+class Runtime:
+    def __init__(self, display, frame_ms=50):
+        self.display = display
+        self.frame_ms = frame_ms  # Target time per frame
+        self.frames = 0
+        self.missed = 0  # Frames that were ready after their deadline
+        self.max_late_ms = 0
+        self._deadlines = {}  # Next frame deadline of each animation task
+        self._start = utime.ticks_ms()
+        self._commands = {
+            "brightness": lambda value: display.brightness(int(value)),
+            "frame_ms": self._set_frame_ms,
+            "stats": lambda: print(self.stats()),
+        }
+
+    def _set_frame_ms(self, value):
+        self.frame_ms = int(value)
+
+    def command(self, name, handler):
+        """Call handler(*args) when a line "name arg ..." arrives on stdin."""
+        self._commands[name] = handler
+
+    async def frame(self, modules=None):
+        """
+        Show the frame drawn so far, then wait for the next frame deadline.
+        modules: the modules that changed, if known (see show()).
+        """
+        if modules is None:
+            self.display.show()
+        else:
+            self.display.show(modules=modules)
+        self.frames += 1
+        task = asyncio.current_task()
+        now = utime.ticks_ms()
+        deadline = utime.ticks_add(self._deadlines.get(task, now), self.frame_ms)
+        wait = utime.ticks_diff(deadline, now)
+        if wait < 0:
+            self.missed += 1
+            if -wait > self.max_late_ms:
+                self.max_late_ms = -wait
+            deadline = now  # Start the next frame from now
+            wait = 0
+        self._deadlines[task] = deadline
+        await asyncio.sleep(wait / 1000)
+
+    async def pause(self, ms):
+        """Hold the current picture for ms without blocking other tasks."""
+        await asyncio.sleep(ms / 1000)
+        # Don't count the pause as a missed deadline; other tasks keep theirs
+        self._deadlines.pop(asyncio.current_task(), None)
+
+    def stats(self):
+        elapsed = utime.ticks_diff(utime.ticks_ms(), self._start)
+        return {
+            "frames": self.frames,
+            "missed": self.missed,
+            "max_late_ms": self.max_late_ms,
+            "fps": self.frames * 1000 // elapsed if elapsed > 0 else 0,
+        }
+
+    def _dispatch(self, line):
+        words = line.split()
+        if not words:
+            return
+        handler = self._commands.get(words[0])
+        if handler is None:
+            print("unknown command:", words[0])
+            return
+        try:
+            handler(*words[1:])
+        except Exception as e:
+            print("command failed:", words[0], e)
+
+    async def _read_commands(self):
+        if sys.implementation.name != "micropython":
+            return  # stdin can't be awaited like this on CPython
+        reader = asyncio.StreamReader(sys.stdin)
+        while True:
+            line = await reader.readline()
+            if line:
+                self._dispatch(line.decode() if isinstance(line, bytes) else line)
+
+    async def _main(self, animations):
+        asyncio.create_task(self._read_commands())
+        tasks = [asyncio.create_task(a) for a in animations]
+        for task in tasks:
+            await task
+
+    def run(self, *animations):
+        """Run the animation coroutines (and the command reader) forever."""
+        asyncio.run(self._main(animations))
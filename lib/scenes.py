@@ -0,0 +1,339 @@
+"""
+The bar's effects as scenes, plus a playlist that rotates them.
+
+A scene draws one whole frame into its display per render(frame) call
+(frame counts from 0 each time the scene comes on) and keeps its own
+state between calls, so several scenes can share one display.  They are
+all built once at startup; switching is just calling a different
+render().  A scene that knows which modules it touched lists them in
+changed (Pong does, from its compositor) and only those are checked by
+show().  Playlist shows each scene for its time slot and blends into
+the next one with a transitions.py effect.  Each scene imports its effect
+module when it is built, so only the effects in the playlist are loaded.
+"""
+
+import random
+import utime
+import transitions
+
+
+class Scene:
+    frame_ms = None  # Preferred frame time, None = the playlist's
+    changed = None  # Modules the last render() touched, None = any of them
+
+    def __init__(self, display):
+        self.display = display
+        self.width = display.width
+        self.height = display.height
+
+    def start(self):
+        """Called every time the scene comes on."""
+
+    def render(self, frame):
+        raise NotImplementedError
+
+
+class Waves(Scene):
+    """matrix-waves.py: one or more waves.KINDS drawn together."""
+
+    frame_ms = 70
+
+    def __init__(self, display, kinds=("sine",), amplitude=3, frequency=0.5, speed=0.07):
+        import waves
+
+        super().__init__(display)
+        self.kinds = [k for k in kinds if k in waves.KINDS]
+        self.engine = waves.WaveEngine(display, amplitude, frequency, speed)
+
+    def render(self, frame):
+        self.display.fill(0)
+        for kind in self.kinds:
+            self.engine.draw(kind)
+        self.engine.advance()
+
+
+class Generative(Scene):
+    """matrix_dots.py effects: "noise", "life", "rule30" (any rule number), "sparkle"."""
+
+    def __init__(self, display, effect="life"):
+        import generative
+
+        super().__init__(display)
+        # The effects keep their state in the frame buffer, so give them
+        # their own copy while other scenes are on
+        shown = bytearray(display.buffer)
+        display.fill(0)
+        self.engine = generative.make_effect(display, effect)
+        self._state = bytearray(display.buffer)
+        display.buffer[:] = shown
+
+    def render(self, frame):
+        display = self.display
+        display.buffer[:] = self._state
+        self.engine.step()
+        self._state[:] = display.buffer
+
+
+class Text(Scene):
+    """scrolling.py: a message scrolling right to left."""
+
+    frame_ms = 30
+
+    def __init__(self, display, message, font=None):
+        from scroller import TextScroller
+
+        super().__init__(display)
+        self.scroller = TextScroller(display, message, font=font)
+
+    def start(self):
+        self.scroller.x = self.width  # Always start from the right edge
+
+    def render(self, frame):
+        self.scroller.step()
+
+
+class Road(Scene):
+    """
+    pole_position.py: a winding road with dashed centre line.  The picture
+    only depends on (road_center, lane_divider_offset), so with cache_bytes
+    each one is drawn once and copied back after that (framecache.py);
+    prewarm draws them all up front.
+    """
+
+    frame_ms = 100
+
+    def __init__(self, display, curve_intensity=1, lane_divider_spacing=2,
+                 cache_bytes=4096, prewarm=False):
+        super().__init__(display)
+        self.curve_intensity = curve_intensity
+        self.lane_divider_spacing = lane_divider_spacing
+        self.road_width = self.width // 3
+        self.max_curve_shift = self.width // 4
+        self.road_center = self.width // 2
+        self.curve_direction = random.choice([-1, 1])
+        self.curve_timer = 0
+        self.lane_divider_offset = 0
+        self.cache = None
+        if cache_bytes:
+            from framecache import FrameCache
+
+            self.cache = FrameCache(display, cache_bytes)
+            if prewarm:
+                shown = bytearray(display.buffer)  # prewarm() leaves the display cleared
+                self.cache.prewarm([(center, offset)
+                                    for center in range(self.max_curve_shift, self.width - self.max_curve_shift + 1)
+                                    for offset in range(lane_divider_spacing)], self.draw)
+                display.buffer[:] = shown
+
+    def draw(self, state):
+        """Draw the road for state = (road_center, lane_divider_offset): wide at the bottom, narrow at the top."""
+        center, offset = state
+        display = self.display
+        width = self.width
+        display.fill(0)
+        for y in range(self.height):
+            perspective = y * 2  # Road gets narrower higher up
+            left = max(center - (self.road_width // 2) + perspective, 0)
+            right = min(center + (self.road_width // 2) - perspective, width - 1)
+            display.pixel(left, y, 1)
+            display.pixel(right, y, 1)
+            if y % 2 == offset % 2 and left + 2 < center < right - 2:
+                display.pixel(center, y, 1)
+
+    def update(self):
+        """Curve the road left or right and move the lane dividers on."""
+        width = self.width
+        self.curve_timer += 1
+        if self.curve_timer > random.randint(10, 20):
+            self.curve_timer = 0
+            self.curve_direction = random.choice([-1, 1])
+        self.road_center += self.curve_direction * self.curve_intensity
+        if self.road_center < self.max_curve_shift:
+            self.road_center = self.max_curve_shift
+            self.curve_direction = 1
+        elif self.road_center > width - self.max_curve_shift:
+            self.road_center = width - self.max_curve_shift
+            self.curve_direction = -1
+        self.lane_divider_offset = (self.lane_divider_offset + 1) % self.lane_divider_spacing
+
+    def render(self, frame):
+        state = (self.road_center, self.lane_divider_offset)
+        if self.cache:
+            self.cache.draw(state, self.draw)
+        else:
+            self.draw(state)
+        self.update()
+
+
+class Pong(Scene):
+    """
+    pong.py: two AI paddles; the score shows for score_frames after each
+    point.  Paddles and ball are compositor sprites, so a game frame only
+    rebuilds the modules they moved across and lists them in changed.
+    """
+
+    frame_ms = 100
+
+    def __init__(self, display, paddle_length=3, paddle_width=2, miss_chance=0.1,
+                 reaction_time=3, max_score=5, score_frames=30):
+        from compositor import Compositor, Sprite
+
+        super().__init__(display)
+        self.paddle_length = paddle_length
+        self.paddle_width = paddle_width
+        self.miss_chance = miss_chance
+        self.reaction_time = reaction_time
+        self.max_score = max_score
+        self.score_frames = score_frames
+        self.screen = Compositor(display)
+        self._left = self.screen.add(Sprite(paddle_width, paddle_length))
+        self._right = self.screen.add(Sprite(paddle_width, paddle_length))
+        self._ball = self.screen.add(Sprite(1, 1))
+        for sprite in (self._left, self._right, self._ball):
+            sprite.fb.fill(1)
+        self.reset()
+
+    def reset(self):
+        """Start the match over (pong.py's "reset" command)."""
+        self.left_y = self.right_y = self.height // 2 - self.paddle_length // 2
+        self.scores = [0, 0]
+        self._score_left = 0  # Frames the score is still shown for
+        self._reset_ball()
+        self.screen.invalidate()
+
+    def start(self):
+        self.screen.invalidate()  # The display holds someone else's picture
+
+    def _reset_ball(self):
+        self.ball_x = self.width // 2
+        self.ball_y = self.height // 2
+        self.ball_dx = random.choice([-1, 1])
+        self.ball_dy = random.choice([-1, 0, 1])
+        self.allow_miss = random.random() < self.miss_chance
+
+    def _move(self, paddle_y):
+        target = self.ball_y - self.paddle_length // 2
+        if paddle_y < target:
+            return min(paddle_y + 1, self.height - self.paddle_length)
+        if paddle_y > target:
+            return max(paddle_y - 1, 0)
+        return paddle_y
+
+    def _point(self, side):
+        self.scores[side] += 1
+        self._score_left = self.score_frames
+        self._reset_ball()
+
+    def _score(self):
+        """One frame of the score screen, drawn straight on the display."""
+        display = self.display
+        width = self.width
+        display.fill(0)
+        display.text(str(self.scores[0]), width // 4, 1, 1)
+        display.text(str(self.scores[1]), (width // 4) * 3, 1, 1)
+        self.changed = None
+        self._score_left -= 1
+        if not self._score_left:
+            self.screen.invalidate()  # Rebuild the whole game picture next frame
+            if max(self.scores) >= self.max_score:
+                self.scores = [0, 0]
+                self._reset_ball()
+
+    def render(self, frame):
+        if self._score_left:
+            self._score()
+            return
+        width = self.width
+
+        # Only the paddle the ball is heading for moves, just before impact
+        until_impact = (width - self.ball_x) if self.ball_dx > 0 else self.ball_x
+        if until_impact <= self.reaction_time and not self.allow_miss:
+            if self.ball_dx > 0:
+                self.right_y = self._move(self.right_y)
+            else:
+                self.left_y = self._move(self.left_y)
+
+        length = self.paddle_length
+        pw = self.paddle_width
+        next_x = self.ball_x + self.ball_dx
+        next_y = self.ball_y + self.ball_dy
+        if next_y < 0 or next_y >= self.height:
+            self.ball_dy = -self.ball_dy
+        if next_x == pw and self.left_y <= self.ball_y < self.left_y + length:
+            self.ball_dx = 1
+            self.ball_dy = random.choice([-1, 0, 1])
+        if next_x == width - pw - 1 and self.right_y <= self.ball_y < self.right_y + length:
+            self.ball_dx = -1
+            self.ball_dy = random.choice([-1, 0, 1])
+        if next_x < 0:
+            self._point(1)
+        elif next_x >= width:
+            self._point(0)
+        self.ball_x += self.ball_dx
+        self.ball_y += self.ball_dy
+        if self._score_left:
+            self._score()  # A point: the score comes up straight away
+            return
+
+        # Left paddle at x=0, right paddle shifted left by its width
+        self._left.move(0, self.left_y)
+        self._right.move(width - pw, self.right_y)
+        self._ball.move(self.ball_x, self.ball_y)
+        self.changed = self.screen.compose()
+
+
+class Playlist:
+    def __init__(self, display, scenes, transition="wipe", steps=16, frame_ms=50):
+        """
+        scenes: list of (scene, seconds).  transition: a name from
+        transitions.TRANSITIONS, steps: frames it takes.  Scenes without
+        their own frame_ms run at this one.
+        """
+        self.display = display
+        self.scenes = scenes
+        self.transition = transitions.TRANSITIONS[transition]
+        self.steps = steps
+        self.frame_ms = frame_ms
+        self.on_switch = None  # Called with the new scene after each transition
+        self._from = bytearray(len(display.buffer))  # Last frame of the old scene
+        self._to = bytearray(len(display.buffer))  # Current frame of the new one
+        self._deadline = utime.ticks_ms()
+
+    def _show(self, scene, modules=None):
+        self.display.show(modules=modules)
+        self._deadline = utime.ticks_add(self._deadline, scene.frame_ms or self.frame_ms)
+        wait = utime.ticks_diff(self._deadline, utime.ticks_ms())
+        if wait > 0:
+            utime.sleep_ms(wait)
+        else:
+            self._deadline = utime.ticks_ms()  # Running late, don't try to catch up
+
+    def _blend(self, scene):
+        """Run the first frames of scene through the transition."""
+        display = self.display
+        buf = display.buffer
+        self._from[:] = buf
+        for step in range(1, self.steps + 1):
+            if step > 1:
+                buf[:] = self._to  # The scene carries on from its own last frame, not the blend
+            scene.render(step - 1)
+            self._to[:] = buf
+            self.transition(buf, self._from, self._to, display.stride, step, self.steps)
+            self._show(scene)
+        return self.steps
+
+    def run(self):
+        """Show the scenes in a loop, blending in from whatever is on the display (e.g. a boot splash)."""
+        index = 0
+        while True:
+            scene, seconds = self.scenes[index]
+            scene.start()
+            frame = self._blend(scene)
+            if self.on_switch:
+                self.on_switch(scene)
+            switch_at = utime.ticks_add(utime.ticks_ms(), int(seconds * 1000))
+            while len(self.scenes) == 1 or utime.ticks_diff(utime.ticks_ms(), switch_at) < 0:
+                scene.render(frame)
+                frame += 1
+                self._show(scene, scene.changed)
+            index = (index + 1) % len(self.scenes)
@@ -0,0 +1,136 @@
+"""
+Text scroller for the Matrix8x8 bar.
+
+The message is drawn once into an off-screen MONO_HLSB strip and each frame
+just blits the visible window, so a frame costs the same for 5 or 500
+characters.  The strip is only rebuilt when the message changes.  Pass a fonts.Font to
+scroll in a custom font instead of the built-in 8x8 one.
+
+Ticker is for text that never ends (a status feed): it pulls characters
+from a generator and/or a queue as they are needed, shifts the display one
+pixel and draws only the new column at the right edge.  Memory and work per
+step stay the same however long the feed runs.
+"""
+
+from collections import deque
+import framebuf
+
+
+class TextScroller:
+    def __init__(self, display, message, y=0, font=None):
+        self.display = display
+        self.width = display.width  # Visible width in pixels
+        self.y = y
+        self.font = font
+        self.message = None
+        self.set_message(message)
+
+    def set_message(self, message):
+        """Change the text; the strip is only re-rendered if it differs."""
+        if message == self.message:
+            return
+        self.message = message
+        font = self.font
+        if font:
+            self.text_width = font.width(message)
+            height = font.height
+        else:
+            self.text_width = len(message) * 8
+            height = 8
+        width = max(self.text_width, 8)
+        self._buffer = bytearray(((width + 7) // 8) * height)
+        self._strip = framebuf.FrameBuffer(self._buffer, width, height, framebuf.MONO_HLSB)
+        if font:
+            font.text(self._strip, message, 0, 0)
+        else:
+            self._strip.text(message, 0, 0, 1)
+        self.x = self.width  # Start just off the right edge
+
+    def step(self):
+        """Draw the next frame into the display. Returns True after a full pass."""
+        display = self.display
+        display.fill(0)
+        display.blit(self._strip, self.x, self.y)
+        self.x -= 1
+        if self.x <= -self.text_width:
+            self.x = self.width
+            return True
+        return False
+
+
+class Ticker:
+    def __init__(self, display, source=None, y=0, font=None, queue_size=16):
+        """
+        source: optional iterator/generator of strings; yield "" when there
+        is nothing new and the ticker scrolls blank columns meanwhile.
+        push() queues extra text, which is shown before the next chunk
+        from source.
+        """
+        self.display = display
+        self.width = display.width
+        self.y = y
+        self.font = font
+        self.height = font.height if font else 8
+        self._source = source
+        self._queue = deque((), queue_size)
+        self._text = ""
+        self._index = 0
+        self._glyph = None  # FrameBuffer of the character being fed in
+        self._glyph_width = 0
+        self._column = 0
+        if font is None:
+            # The built-in font is drawn into one reusable 8x8 cell
+            self._cell = framebuf.FrameBuffer(bytearray(8), 8, 8, framebuf.MONO_HLSB)
+
+    def push(self, text):
+        """Queue text to scroll in; oldest entries drop if the queue is full."""
+        self._queue.append(text)
+
+    def _next_char(self):
+        while self._index >= len(self._text):
+            if self._queue:
+                text = self._queue.popleft()
+            elif self._source is not None:
+                try:
+                    text = next(self._source)
+                except StopIteration:
+                    self._source = None
+                    return None
+            else:
+                return None
+            if not text:
+                return None
+            self._text = text
+            self._index = 0
+        char = self._text[self._index]
+        self._index += 1
+        return char
+
+    def _load_glyph(self):
+        char = self._next_char()
+        if char is None:
+            self._glyph = None
+            self._glyph_width = 1  # Idle: one blank column, then look again
+        elif self.font:
+            self._glyph, width = self.font.glyph(char)
+            self._glyph_width = width + self.font.spacing
+        else:
+            self._cell.fill(0)
+            self._cell.text(char, 0, 0, 1)
+            self._glyph = self._cell
+            self._glyph_width = 8
+        self._column = 0
+
+    def step(self):
+        """Shift the display left one pixel and draw the next column."""
+        if self._column >= self._glyph_width:
+            self._load_glyph()
+        display = self.display
+        x = self.width - 1
+        display.scroll(-1, 0)
+        display.vline(x, self.y, self.height, 0)
+        if self._glyph is not None:
+            # Blit so the glyph's current column lands on x; the columns left
+            # of it redraw what scroll() just moved there, identically
+            display.blit(self._glyph, x - self._column, self.y)
+        self._column += 1
@@ -0,0 +1,138 @@
+"""
+Receive frames streamed from a host over USB serial.
+
+Packet layout (host/stream_sender.py builds these):
+
+    0xA5 0x5A  type  length (2 bytes, little endian)  payload
+
+    type 0  raw frame, payload is len(display.buffer) bytes in Matrix8x8.buffer layout
+    type 1  XOR delta, payload is len(display.buffer) bytes XORed into the last frame
+    type 2  RLE XOR delta: control byte c, then
+              c < 0x80: c + 1 unchanged bytes (skip)
+              c >= 0x80: (c & 0x7F) + 1 bytes follow, XOR them in
+            payload is never longer than a raw frame (send raw instead)
+    type 0xFF  leave stream mode
+
+Raw frames are read with readinto straight into display.buffer, no copies.
+Deltas need an intact previous frame, so senders should send a raw frame
+every so often; a bad header just makes the receiver hunt for the next
+0xA5 0x5A.  Ctrl-C is disabled while streaming (0x03 is a valid pixel
+byte), send type 0xFF to get the REPL back.
+"""
+
+import micropython
+import sys
+import utime
+
+RAW = 0
+XOR = 1
+RLE = 2
+EXIT = 0xFF
+_SYNC0 = 0xA5
+_SYNC1 = 0x5A
+
+
+def apply_rle(buf, src, length):
+    """XOR the first length bytes of src (run-length coded as above) into buf. False if malformed."""
+    size = len(buf)
+    pos = 0
+    i = 0
+    while i < length:
+        control = src[i]
+        i += 1
+        if control < 0x80:
+            pos += control + 1
+        else:
+            count = (control & 0x7F) + 1
+            if pos + count > size or i + count > length:
+                return False
+            for k in range(count):
+                buf[pos + k] ^= src[i + k]
+            pos += count
+            i += count
+    return pos <= size
+
+
+class StreamReceiver:
+    def __init__(self, display, stream=None):
+        self.display = display
+        self.stream = stream if stream is not None else sys.stdin.buffer
+        self.size = len(display.buffer)
+        self._frame = memoryview(display.buffer)
+        self._header = memoryview(bytearray(3))
+        self._byte = memoryview(bytearray(1))
+        self._scratch = bytearray(self.size)
+        self._payload = memoryview(self._scratch)
+        self.frames = 0
+        self.bytes = 0
+        self.bad_packets = 0
+
+    def _read_exact(self, view):
+        """Fill a memoryview completely (serial reads can come back short)."""
+        got = 0
+        while got < len(view):
+            n = self.stream.readinto(view[got:])
+            if n:
+                got += n
+        self.bytes += got
+
+    def _sync(self):
+        """Skip to just after the next 0xA5 0x5A."""
+        byte = self._byte
+        previous = -1
+        while True:
+            self._read_exact(byte)
+            if previous == _SYNC0 and byte[0] == _SYNC1:
+                return
+            previous = byte[0]
+
+    def receive(self):
+        """Read one packet and apply it. Returns its type (EXIT to stop), None if rejected."""
+        self._sync()
+        header = self._header
+        self._read_exact(header)
+        kind = header[0]
+        length = header[1] | (header[2] << 8)
+        if kind == EXIT:
+            return EXIT
+        if kind == RAW and length == self.size:
+            self._read_exact(self._frame)
+        elif kind == XOR and length == self.size:
+            self._read_exact(self._payload[:length])
+            buf = self.display.buffer
+            scratch = self._scratch
+            for i in range(length):
+                buf[i] ^= scratch[i]
+        elif kind == RLE and length <= len(self._scratch):
+            self._read_exact(self._payload[:length])
+            if not apply_rle(self.display.buffer, self._scratch, length):
+                self.bad_packets += 1
+                return None
+        else:
+            self.bad_packets += 1
+            return None
+        self.frames += 1
+        return kind
+
+    def run(self, report_every=0):
+        """
+        Show frames as they arrive until the host sends EXIT.
+        report_every > 0 prints frames per second every that many frames
+        (over the serial port, so only when a terminal is listening).
+        """
+        micropython.kbd_intr(-1)
+        try:
+            start = utime.ticks_ms()
+            while True:
+                kind = self.receive()
+                if kind == EXIT:
+                    return
+                if kind is None:
+                    continue
+                self.display.show()
+                if report_every and self.frames % report_every == 0:
+                    elapsed = utime.ticks_diff(utime.ticks_ms(), start)
+                    print("stream: %d fps, %d bad" % (report_every * 1000 // max(elapsed, 1), self.bad_packets))
+                    start = utime.ticks_ms()
+        finally:
+            micropython.kbd_intr(3)
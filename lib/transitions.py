@@ -0,0 +1,118 @@
+"""
+Scene transitions worked out on packed MONO_HLSB row buffers.
+
+Every transition has the same signature:
+
+    transition(dst, a, b, stride, step, steps)
+
+and writes into dst the frame step (1..steps) of going from buffer a to
+buffer b, where all three are stride bytes per row (display.buffer
+layout).  step == steps always gives exactly b.  They work a byte (8
+pixels) at a time with shifts and masks, never per pixel, so a transition
+frame costs about as much as a fill() and the show() after it is the same
+as any other frame.
+"""
+
+import random
+
+# Per-pixel random 4-bit ranks as 4 bit-planes, one set per buffer size
+_RANKS = {}
+
+
+def _ranks(size):
+    planes = _RANKS.get(size)
+    if planes is None:
+        planes = [bytes(random.getrandbits(8) for _ in range(size)) for _ in range(4)]
+        _RANKS[size] = planes
+    return planes
+
+
+def cut(dst, a, b, stride, step, steps):
+    """No transition, just b."""
+    dst[:] = b
+
+
+def wipe(dst, a, b, stride, step, steps):
+    """b is revealed from the left edge to the right."""
+    edge = (stride * 8 * step) // steps  # First column still showing a
+    full = edge >> 3
+    part = (0xFF00 >> (edge & 7)) & 0xFF  # Left bits of the boundary byte
+    for base in range(0, len(dst), stride):
+        for m in range(stride):
+            i = base + m
+            if m < full:
+                dst[i] = b[i]
+            elif m == full:
+                dst[i] = (b[i] & part) | (a[i] & ~part & 0xFF)
+            else:
+                dst[i] = a[i]
+
+
+def slide(dst, a, b, stride, step, steps):
+    """b pushes a out to the left."""
+    offset = (stride * 8 * step) // steps
+    skip = offset >> 3
+    shift = offset & 7
+    for base in range(0, len(dst), stride):
+        for m in range(stride):
+            # Bytes m + skip and m + skip + 1 of the row "a followed by b"
+            i = m + skip
+            hi = a[base + i] if i < stride else b[base + i - stride]
+            if shift:
+                i += 1
+                if i < stride:
+                    lo = a[base + i]
+                elif i < 2 * stride:
+                    lo = b[base + i - stride]
+                else:
+                    lo = 0
+                hi = ((hi << shift) | (lo >> (8 - shift))) & 0xFF
+            dst[base + m] = hi
+
+
+def _mask(planes, i, level):
+    """Bits of byte i whose rank is below level (0-16), by a bitwise compare."""
+    if level >= 16:
+        return 0xFF
+    below = 0
+    equal = 0xFF
+    for bit in (3, 2, 1, 0):
+        r = planes[bit][i]
+        if level & (1 << bit):
+            below |= equal & ~r
+            equal &= r
+        else:
+            equal &= ~r
+    return below & 0xFF
+
+
+def dissolve(dst, a, b, stride, step, steps):
+    """Pixels switch from a to b in a random order."""
+    planes = _ranks(len(dst))
+    level = (16 * step) // steps
+    for i in range(len(dst)):
+        mask = _mask(planes, i, level)
+        dst[i] = (b[i] & mask) | (a[i] & ~mask & 0xFF)
+
+
+def xor_fade(dst, a, b, stride, step, steps):
+    """b is XORed onto a pixel by pixel, then a is XORed back out, leaving b."""
+    planes = _ranks(len(dst))
+    half = steps / 2
+    if step <= half:
+        level = int(16 * step / half)
+        for i in range(len(dst)):
+            dst[i] = a[i] ^ (b[i] & _mask(planes, i, level))
+    else:
+        level = int(16 * (steps - step) / half)
+        for i in range(len(dst)):
+            dst[i] = b[i] ^ (a[i] & _mask(planes, i, level))
+
+
+TRANSITIONS = {
+    "cut": cut,
+    "wipe": wipe,
+    "slide": slide,
+    "dissolve": dissolve,
+    "xor_fade": xor_fade,
+}
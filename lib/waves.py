@@ -0,0 +1,214 @@
+"""
+Wave and column effects for the Matrix8x8 bar without per-frame float math.
+
+The Pico's RP2040 has no FPU, so sine/cosine/triangle are sampled once into
+integer lookup tables covering a full period.  Each frame only adds a
+fixed-point phase step and reads y from the table.  The column effects
+(KITT, MiddleOut/In, Sonar, EQ) are drawn with fill_rect/vline instead of
+pixel() loops.
+"""
+
+from array import array
+import math
+import random
+import utime
+
+KINDS = ("sine", "cosine", "triangle", "KITT", "MiddleOut", "MiddleIn",
+         "Sonar_Left_to_Right", "Sonar_Right_to_Left", "EQ")
+
+_LUT_BITS = 10  # 1024 samples per period
+_FRAC_BITS = 6  # Fixed-point fraction bits of the phase
+
+
+def _sine(theta, amplitude, mid):
+    return int((math.sin(theta) * amplitude) + mid)
+
+
+def _cosine(theta, amplitude, mid):
+    return int((math.cos(theta) * amplitude) + mid)
+
+
+def _triangle(theta, amplitude, mid):
+    return int(((abs((theta % (2 * math.pi)) - math.pi) - (math.pi / 2)) * (2 * amplitude)) + mid)
+
+
+class WaveEngine:
+    def __init__(self, display, amplitude=3, frequency=0.5, speed=0.07):
+        """
+        amplitude: wave height in pixels, frequency: radians per column,
+        speed: radians the wave moves per frame (same meaning as the
+        wave_* settings in matrix-waves.py).
+        """
+        self.display = display
+        self.width = display.width
+        self.height = display.height
+        self.frame = 0
+        self.amplitude = amplitude
+        one_turn = 1 << (_LUT_BITS + _FRAC_BITS)
+        self._scale = one_turn / (2 * math.pi)  # Radians -> fixed-point table index
+        self._mask = one_turn - 1
+        # The triangle has always ignored wave_frequency, keep it that way
+        self._freqs = {"sine": frequency, "cosine": frequency, "triangle": 1.0}
+        self._step = int(speed * self._scale + 0.5)  # Phase advance per frame
+        self._phase = {kind: 0 for kind in self._freqs}
+        self._luts = {}  # Built on first use, so unused waves cost no RAM
+        self._columns = {}
+        # Byte offset and bit mask of every column in the HLSB buffer
+        self._col_byte = bytearray(x >> 3 for x in range(self.width))
+        self._col_mask = bytearray(0x80 >> (x & 7) for x in range(self.width))
+
+    def _build(self, kind):
+        func = {"sine": _sine, "cosine": _cosine, "triangle": _triangle}[kind]
+        size = 1 << _LUT_BITS
+        mid = self.height // 2
+        lut = array("b", bytes(size))
+        for i in range(size):
+            y = func(2 * math.pi * i / size, self.amplitude, mid)
+            lut[i] = max(-1, min(self.height, y))  # Off-screen -> -1 / height
+        step = int(self._freqs[kind] * self._scale + 0.5)
+        self._luts[kind] = lut
+        self._columns[kind] = array("l", [(x * step) & self._mask for x in range(self.width)])
+
+    def advance(self):
+        """Move every wave on by one frame."""
+        self.frame += 1
+        mask = self._mask
+        for kind in self._phase:
+            self._phase[kind] = (self._phase[kind] + self._step) & mask
+
+    def draw(self, kind):
+        """OR one effect for the current frame into the display buffer."""
+        if kind in self._freqs:
+            self._draw_wave(kind)
+        else:
+            self._draw_columns(kind)
+
+    def position(self, kind):
+        """Column the moving part of a column effect is on this frame, or None."""
+        frame = self.frame
+        width = self.width
+        if kind == "KITT":
+            span = width * 2 - 12
+            pos = frame % span
+            if pos >= width:
+                pos = span - pos
+            return pos + 3  # Middle of the 6 column block
+        if kind == "Sonar_Left_to_Right":
+            return frame % width
+        if kind == "Sonar_Right_to_Left":
+            return width - 1 - (frame % width)
+        return None
+
+    def _draw_wave(self, kind):
+        if kind not in self._luts:
+            self._build(kind)
+        lut = self._luts[kind]
+        columns = self._columns[kind]
+        phase = self._phase[kind]
+        mask = self._mask
+        buf = self.display.buffer
+        stride = self.display.stride
+        col_byte = self._col_byte
+        col_mask = self._col_mask
+        height = self.height
+        for x in range(self.width):
+            y = lut[((columns[x] + phase) & mask) >> _FRAC_BITS]
+            if 0 <= y < height:
+                buf[y * stride + col_byte[x]] |= col_mask[x]
+
+    def _draw_columns(self, kind):
+        d = self.display
+        frame = self.frame
+        width = self.width
+        height = self.height
+        half = width // 2
+        if kind == "KITT":
+            bar_width = 6
+            span = width * 2 - bar_width * 2
+            pos = frame % span  # Bounce within range
+            if pos >= width:
+                pos = span - pos  # Reverse direction
+            d.fill_rect(pos, 0, bar_width, height, 1)
+        elif kind == "MiddleOut":
+            radius = frame % half
+            d.fill_rect(half - radius, 0, 2 * radius + 1, height, 1)
+        elif kind == "MiddleIn":
+            radius = half - (frame % half)
+            d.fill_rect(half - radius, 0, 2 * radius + 1, height, 1)
+        elif kind == "Sonar_Left_to_Right":
+            d.vline(frame % width, 0, height, 1)
+        elif kind == "Sonar_Right_to_Left":
+            d.vline(width - 1 - (frame % width), 0, height, 1)
+        elif kind == "EQ":
+            for x in range(0, width - 5, 6):  # 6 pixel bars, 5 lit + 1 gap
+                bar_height = random.randint(1, height)
+                d.fill_rect(x, height - bar_height, 5, bar_height, 1)
+        else:
+            raise ValueError("Unknown wave type: %s" % kind)
+
+
+def _float_frame(display, kind, frame, amplitude, frequency, speed):
+    """The old per-pixel float rendering, kept only for benchmark()."""
+    width = display.width
+    height = display.height
+    mid = height // 2
+    half = width // 2
+    t = frame * speed
+    if kind in ("sine", "cosine", "triangle"):
+        for x in range(width):
+            if kind == "sine":
+                y = _sine(x * frequency + t, amplitude, mid)
+            elif kind == "cosine":
+                y = _cosine(x * frequency + t, amplitude, mid)
+            else:
+                y = _triangle(x + t, amplitude, mid)
+            if 0 <= y < height:
+                display.pixel(x, y, 1)
+        return
+    if kind == "EQ":
+        for i in range(width // 6):
+            bar_height = random.randint(1, height)
+            for x in range(i * 6, i * 6 + 5):
+                for y in range(height - bar_height, height):
+                    display.pixel(x, y, 1)
+        return
+    if kind == "KITT":
+        pos = frame % (width * 2 - 12)
+        if pos >= width:
+            pos = (width * 2 - 12) - pos
+        columns = range(pos, pos + 6)
+    elif kind == "MiddleOut":
+        radius = frame % half
+        columns = range(half - radius, half + radius + 1)
+    elif kind == "MiddleIn":
+        radius = half - (frame % half)
+        columns = range(half - radius, half + radius + 1)
+    elif kind == "Sonar_Left_to_Right":
+        columns = [frame % width]
+    else:
+        columns = [width - 1 - (frame % width)]
+    for x in columns:
+        if 0 <= x < width:
+            for y in range(height):
+                display.pixel(x, y, 1)
+
+
+def benchmark(display, kinds, frames=50, amplitude=3, frequency=0.5, speed=0.07):
+    """Print the average render cost per frame, old float code vs WaveEngine."""
+    engine = WaveEngine(display, amplitude, frequency, speed)
+    start = utime.ticks_us()
+    for frame in range(frames):
+        display.fill(0)
+        for kind in kinds:
+            _float_frame(display, kind, frame, amplitude, frequency, speed)
+    before = utime.ticks_diff(utime.ticks_us(), start) // frames
+    start = utime.ticks_us()
+    for _ in range(frames):
+        display.fill(0)
+        for kind in kinds:
+            engine.draw(kind)
+        engine.advance()
+    after = utime.ticks_diff(utime.ticks_us(), start) // frames
+    display.fill(0)
+    print("render per frame: %d us float, %d us lookup table" % (before, after))
+    return before, after
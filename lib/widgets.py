@@ -0,0 +1,141 @@
+"""
+Live graphs for the bar: sparkline, bar graph and numeric gauge.
+
+Each widget owns a range of modules (first, count) so several can sit side
+by side.  Samples go into a fixed array('b') ring buffer.  push() on a
+graph shifts just the widget's bytes one column left and draws the new
+column at its right edge, so a sample costs the same however long the
+history is and nothing else on the bar is touched.  Call display.show()
+when it suits (after a batch of pushes, or once per frame).
+"""
+
+from array import array
+
+
+class _Widget:
+    def __init__(self, display, first, count, low, high, history):
+        self.display = display
+        self.first = first  # First module (byte column) of the widget
+        self.count = count  # Modules wide
+        self.x = first * 8
+        self.width = count * 8
+        self.height = display.height
+        self.low = low
+        self.high = high
+        self.samples = array("b", bytes(history))
+        self.index = 0  # Where the next sample goes
+        self.filled = 0  # Samples held so far
+
+    def _store(self, value):
+        samples = self.samples
+        samples[self.index] = value
+        self.index = (self.index + 1) % len(samples)
+        if self.filled < len(samples):
+            self.filled += 1
+
+    def recent(self, n):
+        """The last n stored values, oldest first."""
+        n = min(n, self.filled)
+        size = len(self.samples)
+        return [self.samples[(self.index - n + i) % size] for i in range(n)]
+
+    def _scale(self, value, levels):
+        """Map value onto 0 .. levels - 1 between low and high."""
+        level = int((value - self.low) * levels // (self.high - self.low))
+        return min(max(level, 0), levels - 1)
+
+    def clear(self):
+        self.display.fill_rect(self.x, 0, self.width, self.height, 0)
+
+
+class _Graph(_Widget):
+    def __init__(self, display, first, count, low=0, high=100):
+        # One sample more than the width: the line into the oldest column
+        super().__init__(display, first, count, low, high, count * 8 + 1)
+
+    def _shift(self):
+        """Move the widget's pixels one column left, leaving its last column blank."""
+        buf = self.display.buffer
+        stride = self.display.stride
+        start = self.first
+        last = self.first + self.count - 1
+        for base in range(0, len(buf), stride):
+            for i in range(base + start, base + last):
+                buf[i] = ((buf[i] << 1) | (buf[i + 1] >> 7)) & 0xFF
+            buf[base + last] = (buf[base + last] << 1) & 0xFF
+
+    def _column(self, top, bottom):
+        """Light rows top .. bottom of the rightmost column."""
+        buf = self.display.buffer
+        stride = self.display.stride
+        last = self.first + self.count - 1
+        for y in range(top, bottom + 1):
+            buf[y * stride + last] |= 1
+
+    def push(self, value):
+        """Add a sample: one column shift and one new column."""
+        level = self._level(value)
+        previous = self.samples[(self.index - 1) % len(self.samples)] if self.filled else level
+        self._store(level)
+        self._shift()
+        self._draw(level, previous)
+
+    def redraw(self):
+        """Draw the whole history again, e.g. after something else drew over the widget."""
+        self.clear()
+        history = self.recent(self.width + 1)
+        previous = history[0] if history else 0
+        if len(history) > self.width:
+            history = history[1:]
+        for level in history:
+            self._shift()
+            self._draw(level, previous)
+            previous = level
+
+
+class Sparkline(_Graph):
+    """A line through the last width samples, newest on the right."""
+
+    def _level(self, value):
+        return self._scale(value, self.height)
+
+    def _draw(self, level, previous):
+        # Join to the previous sample so steep changes stay readable
+        height = self.height
+        self._column(height - 1 - max(level, previous), height - 1 - min(level, previous))
+
+
+class BarGraph(_Graph):
+    """One filled bar per sample (0 = empty, full height at high), newest on the right."""
+
+    def _level(self, value):
+        return self._scale(value, self.height + 1)
+
+    def _draw(self, level, previous):
+        if level:
+            self._column(self.height - level, self.height - 1)
+
+
+class Gauge(_Widget):
+    """The latest value (or the average of the last smooth samples) as digits plus a unit."""
+
+    def __init__(self, display, first, count, unit="", smooth=1, low=-128, high=127):
+        super().__init__(display, first, count, low, high, max(smooth, 1))
+        self.unit = unit
+        self.smooth = max(smooth, 1)
+        self.value = None
+
+    def push(self, value):
+        """Add a sample and redraw the digits (only this widget's modules)."""
+        self._store(min(max(int(value), self.low), self.high))
+        history = self.recent(self.smooth)
+        self.value = sum(history) // len(history)
+        text = str(self.value) + self.unit
+        chars = self.width // 8
+        if len(text) > chars:
+            text = str(self.value)
+        if len(text) > chars:
+            text = "#" * chars  # Doesn't fit
+        self.clear()
+        # Right-aligned, so the digits don't jump as the value changes
+        self.display.text(text, self.x + self.width - 8 * len(text), 0, 1)
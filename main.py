@@ -15,17 +15,33 @@ CLK	->	GP2 (SPI0_SCK)
 
 '''
 
-#	matrix-dots.py
+#	main.py
 
+import utime
+boot_ms = utime.ticks_ms()  # ms since reset when main.py starts
 from machine import Pin, SPI
 import max7219
-import random
-from time import sleep
 
 #	CONFIGURATION SETTINGS
 num_max_modules = 12   # Number of MAX7219 modules in a row
 brightness = 0         # Global brightness level (0-15)
-change_speed = 1    # Flickering update interval
+#	Scenes: "pong", "waves", "road", "text", "noise", "life", "rule30", "rule110", "sparkle"
+playlist = [           # (scene, seconds on screen), shown in a loop
+    ("pong", 30),
+    ("waves", 20),
+    ("road", 20),
+    ("text", 15),
+    ("life", 20),
+]
+transition = "wipe"    # Options: "cut", "wipe", "slide", "dissolve", "xor_fade"
+transition_frames = 16 # Frames each transition takes
+frame_ms = 50          # Frame time for scenes that don't have their own
+message = "Hello, Homelab!"  # Text for the "text" scene
+wave_types = ["sine", "cosine"]  # Waves for the "waves" scene (see matrix-waves.py)
+stream_mode = False    # True = show frames sent by host/stream_sender.py over USB
+boot_frame = "last"    # Lit at power-up: "last" (saved while running), "splash" (splash.bin) or None
+splash_text = "1RU"    # Shown when that file doesn't exist yet
+snapshot_minutes = 10  # Save the running frame for the next boot at most this often (flash wear)
 
 #	INITIALIZE DISPLAY
 spi = SPI(0, sck=Pin(2), mosi=Pin(3))
@@ -33,20 +49,44 @@ cs = Pin(5, Pin.OUT)
 display = max7219.Matrix8x8(spi, cs, num_max_modules)
 display.brightness(brightness)
 
-#	Screen dimensions
-width = num_max_modules * 8  # 12 * 8 = 96 pixels
-height = 8  # MAX7219 is always 8 pixels tall
+#	BOOT FRAME: light the bar before the effects are even imported
+if boot_frame:
+    if not display.load_frame("snapshot.bin" if boot_frame == "last" else "splash.bin"):
+        display.text(splash_text, (display.width - 8 * len(splash_text)) // 2, 0, 1)
+    display.show()
+print("boot: main.py at %d ms, first frame at %d ms after reset (target < 100)" % (boot_ms, utime.ticks_ms()))
 
-while True:
-    display.fill(0)  # Clear screen before update
-    
-    for y in range(height):
-        for x in range(width):
-            display.pixel(x, y, random.getrandbits(1))  # Random ON/OFF pixels
+#	Stream mode: the PC does the drawing, the Pico just shows what arrives
+if stream_mode:
+    from stream import StreamReceiver
+    StreamReceiver(display).run()
 
-    display.show()
-    
-    #	Pause for random flickering effect
-    sleep(change_speed)
+#	Every scene is built once up front, switching is instant
+import scenes
+
+def make_scene(name):
+    if name == "pong":
+        return scenes.Pong(display)
+    if name == "waves":
+        return scenes.Waves(display, wave_types)
+    if name == "road":
+        return scenes.Road(display)
+    if name == "text":
+        return scenes.Text(display, message)
+    return scenes.Generative(display, name)
+
+scene_list = [(make_scene(name), seconds) for name, seconds in playlist]
+show = scenes.Playlist(display, scene_list, transition, transition_frames, frame_ms)
+print("boot: playlist ready at %d ms" % utime.ticks_ms())
+
+#	Keep the last frame for the next power-up, rate limited to spare the flash
+last_save = utime.ticks_ms()
 
+def save_snapshot(scene):
+    global last_save
+    if boot_frame == "last" and utime.ticks_diff(utime.ticks_ms(), last_save) >= snapshot_minutes * 60000:
+        display.save_frame("snapshot.bin")
+        last_save = utime.ticks_ms()
 
+show.on_switch = save_snapshot
+show.run()
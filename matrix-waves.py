@@ -19,9 +19,9 @@ CLK	->	GP2 (SPI0_SCK)
 
 from machine import Pin, SPI
 import max7219
-import math
+import waves
+from glow import Glow
 import time
-import random
 
 #	CONFIGURATION SETTINGS
 num_max_modules = 12   # Number of MAX7219 modules in a row
@@ -30,6 +30,8 @@ wave_speed = 0.07      # Speed of wave animation (lower = faster)
 wave_amplitude = 3     # Amplitude (height of wave in pixels)
 wave_frequency = 0.5   # Frequency (wavelength size)
 wave_types = ["Sonar_Left_to_Right", "Sonar_Right_to_Left"]  # Options: "sine", "cosine", "triangle", "KITT", "MiddleOut", "MiddleIn", "Sonar_Left_to_Right", "Sonar_Right_to_Left", "EQ"
+report_cost = False    # Print the per-frame render cost (old float code vs lookup tables) at startup
+glow = False           # Module brightness follows the KITT / sonar position (hardware, no CPU cost)
 
 #	INITIALIZE DISPLAY
 spi = SPI(0, sck=Pin(2), mosi=Pin(3))
@@ -37,107 +39,31 @@ cs = Pin(5, Pin.OUT)
 display = max7219.Matrix8x8(spi, cs, num_max_modules)
 display.brightness(brightness)
 
-#	Screen dimensions
-width = num_max_modules * 8  # 12 * 8 = 96 pixels
-height = 8  # MAX7219 is always 8 pixels tall
-num_bars = width // 6  # Number of EQ bars (each bar is 6 pixels wide)
-
-#	WAVE FUNCTIONS
-def sine_wave(x, time_offset):
-    """Generates a sine wave pattern."""
-    return int((math.sin(x * wave_frequency + time_offset) * wave_amplitude) + (height // 2))
-
-def cosine_wave(x, time_offset):
-    """Generates a cosine wave pattern."""
-    return int((math.cos(x * wave_frequency + time_offset) * wave_amplitude) + (height // 2))
-
-def triangle_wave(x, time_offset):
-    """Generates a triangle wave pattern."""
-    return int(((abs(((x + time_offset) % (2 * math.pi)) - math.pi) - (math.pi / 2)) * (2 * wave_amplitude)) + (height // 2))
-
-def kitt_wave(frame):
-    """Knight Rider-style bouncing LED."""
-    bar_width = 6  # Size of the block
-    pos = (frame % (width * 2 - bar_width * 2))  # Bounce within range
-    if pos >= width:
-        pos = (width * 2 - bar_width * 2) - pos  # Reverse direction
-    return [pos + i for i in range(bar_width)]  # Return block range
-
-def middle_out_wave(frame):
-    """Expands from the middle outward."""
-    radius = frame % (width // 2)  # Expanding radius
-    return list(range((width // 2) - radius, (width // 2) + radius + 1))
-
-def middle_in_wave(frame):
-    """Contracts from the edges inward."""
-    max_radius = width // 2
-    radius = max_radius - (frame % max_radius)  # Shrinking radius
-    return list(range((width // 2) - radius, (width // 2) + radius + 1))
-
-def sonar_left_to_right(frame):
-    """Sweeping motion left to right."""
-    return [frame % width]  # Returns a single column position
-
-def sonar_right_to_left(frame):
-    """Sweeping motion right to left."""
-    return [width - 1 - (frame % width)]  # Returns a single column position
-
-def eq_display(frame):
-    """Simulated EQ bars moving up and down randomly."""
-    bar_heights = [random.randint(1, height) for _ in range(num_bars)]  # Randomized bar heights
-    columns = []
-    
-    for i, bar_height in enumerate(bar_heights):
-        x_start = i * 6  # Each bar is 6 pixels wide
-        for x in range(x_start, x_start + 5):  # Draw bars with spacing
-            for y in range(height - bar_height, height):
-                columns.append((x, y))  # Store coordinates for lighting
-
-    return columns
+#	Validate selected wave types
+selected_wave_types = [w for w in wave_types if w in waves.KINDS]
 
-#	Map wave type to function
-wave_functions = {
-    "sine": sine_wave,
-    "cosine": cosine_wave,
-    "triangle": triangle_wave,
-    "KITT": kitt_wave,
-    "MiddleOut": middle_out_wave,
-    "MiddleIn": middle_in_wave,
-    "Sonar_Left_to_Right": sonar_left_to_right,
-    "Sonar_Right_to_Left": sonar_right_to_left,
-    "EQ": eq_display
-}
+if report_cost:
+    waves.benchmark(display, selected_wave_types, amplitude=wave_amplitude,
+                    frequency=wave_frequency, speed=wave_speed)
 
-#	Validate selected wave types
-selected_wave_functions = [wave_functions[w] for w in wave_types if w in wave_functions]
+#	WAVE ENGINE (sine/cosine/triangle come from lookup tables built once)
+engine = waves.WaveEngine(display, wave_amplitude, wave_frequency, wave_speed)
+glow_effect = Glow(display) if glow else None
 
 #	ANIMATION LOOP
-frame = 0  #	Used for movement
 while True:
     display.fill(0)  #	Clear screen
 
-    for wave_function in selected_wave_functions:
-        if wave_function in [sine_wave, cosine_wave, triangle_wave]:
-            #	Smooth waveform display
-            for x in range(width):
-                y = wave_function(x, frame * wave_speed)  #	Compute y position
-                if 0 <= y < height:
-                    display.pixel(x, y, 1)  #	Light up the corresponding pixel
+    for wave_type in selected_wave_types:
+        engine.draw(wave_type)
 
-        elif wave_function in [eq_display]:
-            #	EQ display effect
-            for x, y in wave_function(frame):
-                display.pixel(x, y, 1)
-
-        else:
-            #	Bouncing block, middle, and sonar waves
-            for x in wave_function(frame):
-                if 0 <= x < width:
-                    for y in range(height):  #	Fill the column
-                        display.pixel(x, y, 1)
+    if glow_effect:
+        for wave_type in selected_wave_types:
+            x = engine.position(wave_type)
+            if x is not None:
+                glow_effect.follow(x)  #	Brightest module follows the moving column
+                break
 
     display.show()
-    frame += 1  #	Advance animation frame
+    engine.advance()  #	Advance animation frame
     time.sleep(wave_speed)  #	Control speed
-
-
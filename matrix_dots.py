@@ -19,13 +19,15 @@ CLK	->	GP2 (SPI0_SCK)
 
 from machine import Pin, SPI
 import max7219
-import random
+import generative
 from time import sleep
 
 #	CONFIGURATION SETTINGS
 num_max_modules = 12   # Number of MAX7219 modules in a row
 brightness = 0         # Global brightness level (0-15)
 change_speed = 1    # Flickering update interval
+effect = "noise"       # Options: "noise", "life", "rule30", "rule110", "sparkle"
+report_cost = False    # Print what a Life / rule 30 step costs at startup
 
 #	INITIALIZE DISPLAY
 spi = SPI(0, sck=Pin(2), mosi=Pin(3))
@@ -33,16 +35,15 @@ cs = Pin(5, Pin.OUT)
 display = max7219.Matrix8x8(spi, cs, num_max_modules)
 display.brightness(brightness)
 
-#	Screen dimensions
-width = num_max_modules * 8  # 12 * 8 = 96 pixels
-height = 8  # MAX7219 is always 8 pixels tall
+if report_cost:
+    generative.benchmark(display)
+
+#	Effects work on the packed frame buffer directly (no per-pixel calls);
+#	the same ones run in main.py's playlist
+engine = generative.make_effect(display, effect)
 
 while True:
-    display.fill(0)  # Clear screen before update
-    
-    for y in range(height):
-        for x in range(width):
-            display.pixel(x, y, random.getrandbits(1))  # Random ON/OFF pixels
+    engine.step()  # "noise": random ON/OFF pixels
 
     display.show()
     
@@ -21,8 +21,8 @@ CLK	->	GP2 (SPI0_SCK)
 
 from machine import Pin, SPI
 import max7219
+from scenes import Road
 import time
-import random
 
 # 🔧 CONFIGURATION SETTINGS 🔧
 num_max_modules = 12   # Number of MAX7219 modules in a row
@@ -30,6 +30,9 @@ speed = 0.1            # Speed of the animation (lower = faster)
 brightness = 0         # Brightness level (0-15)
 curve_intensity = 1    # How sharply the road curves (higher = more aggressive turns)
 lane_divider_spacing = 2  # Spacing between dashed lines
+cache_bytes = 10 * 1024   # RAM for ready-drawn road frames (0 = draw every frame)
+prewarm = True         # Draw every road position at startup instead of on first use
+cache_report = 0       # Print cache hit/miss stats every N frames (0 = never)
 
 # 🔌 INITIALIZE DISPLAY 🔌
 spi = SPI(0, sck=Pin(2), mosi=Pin(3))
@@ -39,69 +42,19 @@ display = max7219.Matrix8x8(spi, cs, num_max_modules)
 # 🔥 Set brightness
 display.brightness(brightness)
 
-# Screen dimensions
-width = num_max_modules * 8  # Total width of the display
-height = 8  # MAX7219 is always 8 pixels tall
-
-# 🌄 ROAD VARIABLES 🌄
-road_center = width // 2  # Road center position
-road_width = width // 3  # Base width of the road at the bottom
-curve_direction = random.choice([-1, 1])  # -1 (left), 1 (right)
-curve_timer = 0  # Determines when to change curves
-max_curve_shift = width // 4  # Max left/right movement
-
-lane_divider_offset = 0  # Controls the movement of the dashed lines
-
-def draw_road():
-    """Draws a road with correct perspective: wide at the bottom, narrow at the top."""
-    display.fill(0)  # Clear screen
-
-    for y in range(height):
-        perspective = y * 2  # Road gets narrower higher up
-
-        left_road = max(road_center - (road_width // 2) + perspective, 0)
-        right_road = min(road_center + (road_width // 2) - perspective, width - 1)
-        center_road = road_center  # Center lane moves with road
-
-        # Draw road edges
-        if 0 <= left_road < width:
-            display.pixel(left_road, y, 1)
-        if 0 <= right_road < width:
-            display.pixel(right_road, y, 1)
-
-        # Draw dashed center lane
-        if y % 2 == (lane_divider_offset % 2):  # Makes it dashed
-            if left_road + 2 < center_road < right_road - 2:  # Keep it within the road
-                display.pixel(center_road, y, 1)
-
-def update_road():
-    """Moves the road left or right and updates lane dividers."""
-    global road_center, curve_direction, curve_timer, lane_divider_offset
-
-    # Change curve direction randomly over time
-    curve_timer += 1
-    if curve_timer > random.randint(10, 20):  # Change direction randomly
-        curve_timer = 0
-        curve_direction = random.choice([-1, 1])  # Left or right turn
-
-    # Shift the road position
-    road_center += curve_direction * curve_intensity
-
-    # Keep the road within boundaries
-    if road_center < max_curve_shift:
-        road_center = max_curve_shift
-        curve_direction = 1
-    elif road_center > width - max_curve_shift:
-        road_center = width - max_curve_shift
-        curve_direction = -1
-
-    # Move the lane dividers for a moving effect
-    lane_divider_offset = (lane_divider_offset + 1) % lane_divider_spacing
+# 🌄 ROAD 🌄
+# The road is scenes.Road, the same one main.py's playlist runs.  The
+# picture only depends on (road_center, lane_divider_offset), so each one
+# is drawn once and copied back into the buffer after that
+road = Road(display, curve_intensity, lane_divider_spacing, cache_bytes, prewarm)
 
 # ⏳ GAME LOOP ⏳
+road.start()
+frames = 0
 while True:
-    draw_road()
-    update_road()
+    road.render(frames)
     display.show()
+    frames += 1
+    if road.cache and cache_report and frames % cache_report == 0:
+        print(road.cache.stats())
     time.sleep(speed)
-
@@ -19,8 +19,8 @@ CLK	->	GP2 (SPI0_SCK)
 
 from machine import Pin, SPI
 import max7219
-import time
-import random
+from runtime import Runtime
+from scenes import Pong
 
 # 🔧 CONFIGURATION SETTINGS 🔧
 num_max_modules = 12  # Number of MAX7219 modules in a row
@@ -40,140 +40,25 @@ display = max7219.Matrix8x8(spi, cs, num_max_modules)
 # 🔥 Set brightness (0-15)
 display.brightness(brightness)
 
-# Screen dimensions
-width = num_max_modules * 8  # Total width of the display
-height = 8  # MAX7219 is always 8 pixels tall
+# 🏓 The game itself is scenes.Pong, the same one main.py's playlist runs.
+# Paddles and ball are sprites: each frame only the modules they move
+# across are rebuilt and checked, the rest of the bar is left alone
+game = Pong(display, paddle_length, paddle_width, miss_chance, reaction_time, max_score,
+            score_frames=int(3 / game_speed))  # Score shows for 3 seconds
 
-# PADDLE POSITION
-left_paddle_y = height // 2 - paddle_length // 2
-right_paddle_y = height // 2 - paddle_length // 2
-
-# BALL POSITION AND DIRECTION
-ball_x = width // 2
-ball_y = height // 2
-ball_dx = random.choice([-1, 1])  # Direction: -1 (left), 1 (right)
-ball_dy = random.choice([-1, 0, 1])  # Vertical variation
-
-# SCORES
-left_score = 0
-right_score = 0
-allow_miss = False  # Flag to determine if a paddle will miss
-
-def draw_paddle(x, y):
-    """Draws a paddle at (x, y) with the configured width."""
-    for i in range(paddle_length):  # Draw paddle height
-        for j in range(paddle_width):  # Draw paddle width
-            display.pixel(x + j, y + i, 1)  # Offset horizontally by width
-
-def move_paddle(target_paddle_y, paddle_y):
-    """Moves paddle toward target position."""
-    if paddle_y < target_paddle_y:
-        return min(paddle_y + 1, height - paddle_length)
-    elif paddle_y > target_paddle_y:
-        return max(paddle_y - 1, 0)
-    return paddle_y  # Stay in place
-
-def ai_paddle_movement():
-    """Moves only the paddle that the ball is traveling toward and only just before impact."""
-    global left_paddle_y, right_paddle_y, allow_miss
-
-    # Determine how many frames until impact
-    frames_until_impact = (width - ball_x) if ball_dx > 0 else ball_x
-
-    # If the ball is moving right, control the right paddle
-    if ball_dx > 0 and frames_until_impact <= reaction_time:
-        if allow_miss:  # If AI is set to miss, do nothing
-            return
-        right_paddle_y = move_paddle(ball_y - paddle_length // 2, right_paddle_y)
-
-    # If the ball is moving left, control the left paddle
-    elif ball_dx < 0 and frames_until_impact <= reaction_time:
-        if allow_miss:  # If AI is set to miss, do nothing
-            return
-        left_paddle_y = move_paddle(ball_y - paddle_length // 2, left_paddle_y)
-
-def reset_ball():
-    """Resets the ball position and randomizes direction."""
-    global ball_x, ball_y, ball_dx, ball_dy, allow_miss
-    ball_x = width // 2
-    ball_y = height // 2
-    ball_dx = random.choice([-1, 1])
-    ball_dy = random.choice([-1, 0, 1])
-
-    # Randomly decide if the paddle should miss
-    allow_miss = random.random() < miss_chance
-
-def update_ball():
-    """Updates the ball's position and checks collisions."""
-    global ball_x, ball_y, ball_dx, ball_dy, left_score, right_score
-
-    next_x = ball_x + ball_dx
-    next_y = ball_y + ball_dy
-
-    # Ball Collision with Top and Bottom Walls
-    if next_y < 0 or next_y >= height:
-        ball_dy = -ball_dy  # Reverse vertical direction
-
-    # Ball Collision with Left Paddle
-    if next_x == paddle_width and left_paddle_y <= ball_y < left_paddle_y + paddle_length:
-        ball_dx = 1  # Bounce right
-        ball_dy = random.choice([-1, 0, 1])  # Random vertical change
-
-    # Ball Collision with Right Paddle
-    if next_x == width - paddle_width - 1 and right_paddle_y <= ball_y < right_paddle_y + paddle_length:
-        ball_dx = -1  # Bounce left
-        ball_dy = random.choice([-1, 0, 1])  # Random vertical change
-
-    # Ball Out of Bounds (Scoring)
-    if next_x < 0:
-        right_score += 1  # Right player scores
-        show_score()
-        reset_ball()
-    elif next_x >= width:
-        left_score += 1  # Left player scores
-        show_score()
-        reset_ball()
-
-    # Move ball
-    ball_x += ball_dx
-    ball_y += ball_dy
-
-def show_score():
-    """Shows the score for 3 seconds before resuming."""
-    display.fill(0)
-    display.text(str(left_score), width // 4, 1, 1)
-    display.text(str(right_score), (width // 4) * 3, 1, 1)
-    display.show()
-    time.sleep(3)  # Pause for 3 seconds before resuming
+# ⏱ Frames are paced by the runtime, which also takes commands over USB serial
+# (try "brightness 5", "frame_ms 50", "reset" or "stats")
+runtime = Runtime(display, frame_ms=int(game_speed * 1000))
+runtime.command("reset", game.reset)
 
 # ⏳ GAME LOOP ⏳
-while True:
-    display.fill(0)  # Clear screen
-
-    # Move only the paddle that the ball is approaching
-    ai_paddle_movement()
-
-    # Update ball movement
-    update_ball()
-
-    # Draw left paddle (starts at x=0)
-    draw_paddle(0, left_paddle_y)
-
-    # Draw right paddle (shift left by paddle width to fit on screen)
-    draw_paddle(width - paddle_width, right_paddle_y)
-
-    # Draw ball
-    display.pixel(ball_x, ball_y, 1)
-
-    # Display everything
-    display.show()
-
-    # Check if max score is reached
-    if left_score >= max_score or right_score >= max_score:
-        show_score()
-        left_score = 0
-        right_score = 0
-        reset_ball()
-
-    time.sleep(game_speed)  # Control game speed
-
+async def play():
+    game.start()
+    frame = 0
+    while True:
+        game.render(frame)
+        frame += 1
+        # Display the modules that changed and wait for the next frame (controls game speed)
+        await runtime.frame(game.changed)
+
+runtime.run(play())
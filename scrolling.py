@@ -19,6 +19,7 @@ CLK	->	GP2 (SPI0_SCK)
 
 from machine import Pin, SPI
 import max7219
+from scroller import TextScroller
 from time import sleep
 
 #	CONFIGURATION SETTINGS
@@ -34,21 +35,13 @@ cs = Pin(5, Pin.OUT)
 display = max7219.Matrix8x8(spi, cs, num_max_modules)
 display.brightness(brightness)
 
-#	CALCULATE DISPLAY WIDTH & TEXT SIZE
-display_width = num_max_modules * 8  # Total width in pixels
-text_width = len(scrolling_message) * 8  # Total text width in pixels
-
-#	Clear display before scrolling
-display.fill(0)
-display.show()
-sleep(1)
+#	RENDER THE MESSAGE ONCE (only the visible window is copied each frame)
+scroller = TextScroller(display, scrolling_message)
 
 #	SCROLLING LOOP
 while True:
-    for x in range(display_width, -text_width, -1):     
-        display.fill(0)
-        display.text(scrolling_message, x, 0, 1)
-        display.show()
-        sleep(scroll_speed)
+    scroller.step()
+    display.show()
+    sleep(scroll_speed)
 
 
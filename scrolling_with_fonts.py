@@ -1,6 +1,4 @@
 '''
-Status: Not woking
-
 Date: 2025-03-09
 
 References:
@@ -21,6 +19,8 @@ CLK	->	GP2 (SPI0_SCK)
 
 from machine import Pin, SPI
 import max7219
+from fonts import Font
+from scroller import TextScroller
 from time import sleep
 
 # 🔧 CONFIGURATION
@@ -43,26 +43,12 @@ cs = Pin(5, Pin.OUT)
 display = max7219.Matrix8x8(spi, cs, num_max_modules)
 display.brightness(brightness)
 
-display_width = num_max_modules * 8  # Display width in pixels
-column_offset = display_width  # Start off-screen
-
-# Function to draw a character from FONT_5x8
-def draw_char(display, char, x):
-    if char in FONT_5x8:
-        bitmap = FONT_5x8[char]
-        for col in range(len(bitmap)):  # Loop through each column of pixels
-            for row in range(8):  # Loop through each row of pixels
-                pixel_on = (bitmap[col] >> row) & 1
-                display.pixel(x + col, row, pixel_on)
+# Glyphs are converted once and cached, the message is rendered once
+font = Font(FONT_5x8)
+scroller = TextScroller(display, scrolling_message, font=font)
 
 # Scrolling Loop
 while True:
-    for x in range(display_width, -len(scrolling_message) * 6, -1):  
-        display.fill(0)
-
-        for i, char in enumerate(scrolling_message):
-            draw_char(display, char, x + (i * 6))
-
-        display.show()
-        sleep(scroll_speed)
-
+    scroller.step()
+    display.show()
+    sleep(scroll_speed)
@@ -0,0 +1,51 @@
+'''
+Date: 2026-10-18
+
+References:
+https://github.com/mcauser/micropython-max7219
+
+MAX7219 Module	->	Pico
+VCC	->	VBUS (5V)
+GND	->	GND
+DIN	->	GP3 (SPI0_TX)
+CS	->	GP5 (SPI0_CSN)
+CLK	->	GP2 (SPI0_SCK)
+
+'''
+
+#	status_ticker.py
+
+from machine import Pin, SPI
+import max7219
+from scroller import Ticker
+import gc
+import time
+
+#	CONFIGURATION SETTINGS
+num_max_modules = 12   # Number of MAX7219 modules in a row
+scroll_speed = 0.03    # Seconds per one-pixel step
+brightness = 0         # Global brightness level (0-15)
+
+#	INITIALIZE DISPLAY
+spi = SPI(0, sck=Pin(2), mosi=Pin(3))
+cs = Pin(5, Pin.OUT)
+display = max7219.Matrix8x8(spi, cs, num_max_modules)
+display.brightness(brightness)
+display.fill(0)
+
+#	STATUS FEED (swap in your own rack metrics here)
+def status_feed():
+    """Never-ending status text, one chunk at a time."""
+    start = time.ticks_ms()
+    while True:
+        uptime = time.ticks_diff(time.ticks_ms(), start) // 1000
+        yield " up %ds  free %dk  *" % (uptime, gc.mem_free() // 1024)
+
+ticker = Ticker(display, status_feed())
+ticker.push("Rack 1 online  *")
+
+#	TICKER LOOP
+while True:
+    ticker.step()
+    display.show()
+    time.sleep(scroll_speed)
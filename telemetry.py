@@ -0,0 +1,75 @@
+'''
+Date: 2026-10-18
+
+References:
+https://github.com/mcauser/micropython-max7219
+https://www.raspberrypi.com/documentation/pico-sdk/hardware.html#group_hardware_adc
+
+MAX7219 Module	->	Pico
+VCC	->	VBUS (5V)
+GND	->	GND
+DIN	->	GP3 (SPI0_TX)
+CS	->	GP5 (SPI0_CSN)
+CLK	->	GP2 (SPI0_SCK)
+
+Feed it from the server over USB serial, one line per sample, e.g.
+echo "cpu 37" > /dev/ttyACM0
+Commands: cpu <0-100>, net <0-100>, temp <degrees>
+
+'''
+
+#	telemetry.py
+
+from machine import Pin, SPI, ADC
+import max7219
+try:
+    import asyncio
+except ImportError:
+    import uasyncio as asyncio
+from runtime import Runtime
+from widgets import Sparkline, BarGraph, Gauge
+
+#	CONFIGURATION SETTINGS
+num_max_modules = 12   # Number of MAX7219 modules in a row
+brightness = 0         # Global brightness level (0-15)
+frame_ms = 100         # How often changes are sent to the bar
+cpu_modules = (0, 4)   # (first module, modules wide) of the CPU sparkline
+net_modules = (4, 4)   # ... of the network bar graph (0-100 = % of link)
+temp_modules = (8, 4)  # ... of the temperature gauge
+local_temp = True      # Show the Pico's own temperature until "temp" lines arrive
+local_temp_ms = 2000   # How often to read it
+
+#	INITIALIZE DISPLAY
+spi = SPI(0, sck=Pin(2), mosi=Pin(3))
+cs = Pin(5, Pin.OUT)
+display = max7219.Matrix8x8(spi, cs, num_max_modules)
+display.brightness(brightness)
+runtime = Runtime(display, frame_ms=frame_ms)
+
+#	WIDGETS (each sample only redraws its own widget)
+cpu = Sparkline(display, *cpu_modules)
+net = BarGraph(display, *net_modules)
+temp = Gauge(display, *temp_modules, unit="C", smooth=4)
+
+def set_temp(value):
+    global local_temp
+    local_temp = False  # The server knows better, stop reading the sensor
+    temp.push(float(value))
+
+runtime.command("cpu", lambda value: cpu.push(float(value)))
+runtime.command("net", lambda value: net.push(float(value)))
+runtime.command("temp", set_temp)
+
+async def sensor():
+    """RP2040 temperature sensor (ADC 4): 27 C at 0.706 V, -1.721 mV per degree."""
+    adc = ADC(4)
+    while local_temp:
+        volts = adc.read_u16() * 3.3 / 65535
+        temp.push(27 - (volts - 0.706) / 0.001721)
+        await asyncio.sleep_ms(local_temp_ms)  # Not runtime.pause(): this task draws no frames
+
+async def refresh():
+    while True:
+        await runtime.frame()  # Only rows that changed are sent
+
+runtime.run(refresh(), sensor())